@@ -9,12 +9,42 @@ import django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 django.setup()
 
+from contextlib import asynccontextmanager
+
+from asgiref.sync import sync_to_async
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from django.conf import settings
+from django.db import close_old_connections, connection
 
 from api.routes import orders, auth, pdf, templates, clients, operator, signatures
 
+
+@sync_to_async
+def _warm_db_connection():
+    """Open the database connection in the ORM thread."""
+    connection.ensure_connection()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Connect to the database before the first request."""
+    await _warm_db_connection()
+    yield
+
+
+class DBConnectionMiddleware:
+    """Drop expired or broken connections, as Django does on request_started."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            await sync_to_async(close_old_connections)()
+        await self.app(scope, receive, send)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Annex 9 Generator API",
@@ -23,8 +53,11 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    lifespan=lifespan,
 )
 
+app.add_middleware(DBConnectionMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
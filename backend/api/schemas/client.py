@@ -8,6 +8,8 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 from enum import Enum
 
+from .types import PostalCodeStr
+
 
 class TitleType(str, Enum):
     MADAME = "Madame"
@@ -21,7 +23,7 @@ class ClientBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=200)
     address: str = Field(..., min_length=1, max_length=300)
     address_number: Optional[str] = ""
-    postal_code: str = Field(..., pattern=r"^\d{4,5}$")
+    postal_code: PostalCodeStr
     locality: str = Field(..., min_length=1, max_length=100)
     phone: Optional[str] = ""
     gsm: Optional[str] = ""
@@ -38,7 +40,7 @@ class ClientUpdate(BaseModel):
     name: Optional[str] = None
     address: Optional[str] = None
     address_number: Optional[str] = None
-    postal_code: Optional[str] = None
+    postal_code: Optional[PostalCodeStr] = None
     locality: Optional[str] = None
     phone: Optional[str] = None
     gsm: Optional[str] = None
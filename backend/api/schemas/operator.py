@@ -7,6 +7,8 @@ from typing import Optional
 from pydantic import BaseModel, Field
 from enum import Enum
 
+from .types import PostalCodeStr
+
 
 class TitleType(str, Enum):
     MADAME = "Madame"
@@ -20,7 +22,7 @@ class OperatorConfigBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=200)
     address: str = Field(..., min_length=1, max_length=300)
     address_number: Optional[str] = ""
-    postal_code: str = Field(..., pattern=r"^\d{4,5}$")
+    postal_code: PostalCodeStr
     locality: str = Field(..., min_length=1, max_length=100)
     bce_number: Optional[str] = ""
     authorization_number: Optional[str] = ""
@@ -33,7 +35,7 @@ class OperatorConfigUpdate(BaseModel):
     name: Optional[str] = None
     address: Optional[str] = None
     address_number: Optional[str] = None
-    postal_code: Optional[str] = None
+    postal_code: Optional[PostalCodeStr] = None
     locality: Optional[str] = None
     bce_number: Optional[str] = None
     authorization_number: Optional[str] = None
@@ -9,6 +9,8 @@ from uuid import UUID
 from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 
+from .types import PostalCodeStr
+
 
 class ServiceType(str, Enum):
     ALLER = "aller"
@@ -41,7 +43,7 @@ class OrderBase(BaseModel):
     operator_name: str = Field(..., min_length=1, max_length=200)
     operator_address: str = Field(..., min_length=1, max_length=300)
     operator_address_number: Optional[str] = ""
-    operator_postal_code: str = Field(..., pattern=r"^\d{4,5}$")
+    operator_postal_code: PostalCodeStr
     operator_locality: str = Field(..., min_length=1, max_length=100)
     operator_bce_number: Optional[str] = ""
     operator_authorization_number: Optional[str] = ""
@@ -52,7 +54,7 @@ class OrderBase(BaseModel):
     client_name: str = Field(..., min_length=1, max_length=200)
     client_address: str = Field(..., min_length=1, max_length=300)
     client_address_number: Optional[str] = ""
-    client_postal_code: str = Field(..., pattern=r"^\d{4,5}$")
+    client_postal_code: PostalCodeStr
     client_locality: str = Field(..., min_length=1, max_length=100)
     client_phone: Optional[str] = ""
     client_gsm: Optional[str] = ""
@@ -100,7 +102,7 @@ class OrderUpdate(BaseModel):
     operator_name: Optional[str] = None
     operator_address: Optional[str] = None
     operator_address_number: Optional[str] = None
-    operator_postal_code: Optional[str] = None
+    operator_postal_code: Optional[PostalCodeStr] = None
     operator_locality: Optional[str] = None
     operator_bce_number: Optional[str] = None
     operator_authorization_number: Optional[str] = None
@@ -110,7 +112,7 @@ class OrderUpdate(BaseModel):
     client_name: Optional[str] = None
     client_address: Optional[str] = None
     client_address_number: Optional[str] = None
-    client_postal_code: Optional[str] = None
+    client_postal_code: Optional[PostalCodeStr] = None
     client_locality: Optional[str] = None
     client_phone: Optional[str] = None
     client_gsm: Optional[str] = None
@@ -0,0 +1,10 @@
+"""
+Shared constrained types for Pydantic schemas.
+"""
+
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+# 4-digit (BE/LU) or 5-digit (FR) postal code
+PostalCodeStr = Annotated[str, StringConstraints(pattern=r"^\d{4,5}$")]
@@ -1,3 +1,13 @@
-from .pdf_generator import generate_annex9_pdf
+from .pdf_generator import (
+    content_hash,
+    generate_annex9_pdf,
+    render_annex9_pdf,
+    render_annex9_pdf_batch,
+)
 
-__all__ = ["generate_annex9_pdf"]
+__all__ = [
+    "content_hash",
+    "generate_annex9_pdf",
+    "render_annex9_pdf",
+    "render_annex9_pdf_batch",
+]
@@ -0,0 +1,88 @@
+"""
+Benchmark harness for the Annex 9 PDF generator.
+
+Renders a few unsaved sample orders in a loop, without touching the database,
+so the time spent in Python glue versus ReportLab can be profiled:
+
+    cd backend
+    scalene --profile-interval 0.001 --cpu --memory api/services/_bench_pdf.py --- 500
+
+Also runs under plain Python and prints the mean render time.
+"""
+
+import os
+import sys
+import time as timer
+from datetime import date, time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django
+
+django.setup()
+
+from core.models import Order
+from api.services.pdf_generator import render_annex9_pdf
+
+
+def sample_orders() -> list:
+    """Build unsaved orders covering each service type and title."""
+    common = dict(
+        reservation_date=date(2025, 1, 2),
+        reservation_number="R-0001",
+        operator_name="Taxis Collectifs SPRL",
+        operator_address="Rue de Fer",
+        operator_address_number="12",
+        operator_postal_code="5000",
+        operator_locality="Namur",
+        operator_bce_number="0123.456.789",
+        operator_authorization_number="TC-42",
+        operator_authorization_date=date(2020, 5, 1),
+        client_name="Dupont",
+        client_address="Avenue Louise",
+        client_address_number="3",
+        client_postal_code="1050",
+        client_locality="Bruxelles",
+        client_phone="02 123 45 67",
+        client_gsm="0470 12 34 56",
+        passengers_adult=2,
+        passengers_child=1,
+        aller_date=date(2025, 1, 3),
+        aller_time=time(10, 30),
+        aller_departure="Gare de Namur",
+        aller_destination="Aéroport de Charleroi",
+        aller_price=Decimal("12.50"),
+    )
+    return [
+        Order(reference="TC-2025-000001", service_type="aller", **common),
+        Order(
+            reference="TC-2025-000002",
+            service_type="aller_retour",
+            operator_title="Madame",
+            client_title="Société",
+            retour_date=date(2025, 1, 5),
+            retour_time=time(18, 0),
+            retour_departure="Aéroport de Charleroi",
+            retour_destination="Gare de Namur",
+            retour_price=Decimal("12.50"),
+            **common,
+        ),
+        Order(reference="TC-2025-000003", service_type="retour", client_title="Madame", **common),
+    ]
+
+
+def main(iterations: int) -> None:
+    orders = sample_orders()
+
+    start = timer.perf_counter()
+    for i in range(iterations):
+        render_annex9_pdf(orders[i % len(orders)])
+    elapsed = timer.perf_counter() - start
+
+    print(f"{iterations} renders, {elapsed * 1000 / iterations:.2f} ms/render")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
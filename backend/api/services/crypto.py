@@ -1,16 +1,25 @@
 """
 Cryptographic utilities for secure signature storage.
 
-Uses Fernet symmetric encryption (AES-128-CBC with HMAC).
+New signatures use AES-256-GCM; signatures stored earlier with Fernet
+(AES-128-CBC with HMAC) remain readable.
 """
 
 import base64
 import os
+from functools import lru_cache
 from typing import Optional
 
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from django.conf import settings
 
+# Leading byte of AES-GCM payloads; Fernet tokens always start with b"g"
+AESGCM_VERSION = b"\x01"
+NONCE_SIZE = 12
+
 
 def get_encryption_key() -> bytes:
     """
@@ -42,19 +51,36 @@ def get_encryption_key() -> bytes:
     return key
 
 
+@lru_cache(maxsize=1)
+def get_fernet() -> Fernet:
+    """Build the Fernet instance once; only used to read legacy signatures."""
+    return Fernet(get_encryption_key())
+
+
+@lru_cache(maxsize=1)
+def get_aesgcm() -> AESGCM:
+    """Build the AES-GCM cipher once from a key derived from the configured secret."""
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b"annex9-signature-aesgcm",
+    )
+    return AESGCM(hkdf.derive(base64.urlsafe_b64decode(get_encryption_key())))
+
+
 def encrypt_signature(data: bytes) -> bytes:
     """
-    Encrypt signature data using Fernet encryption.
+    Encrypt signature data using AES-256-GCM.
 
     Args:
         data: Raw signature data (typically PNG image bytes)
 
     Returns:
-        Encrypted data
+        Encrypted data (version byte + nonce + ciphertext and tag)
     """
-    key = get_encryption_key()
-    f = Fernet(key)
-    return f.encrypt(data)
+    nonce = os.urandom(NONCE_SIZE)
+    return AESGCM_VERSION + nonce + get_aesgcm().encrypt(nonce, data, None)
 
 
 def decrypt_signature(encrypted_data: bytes) -> bytes:
@@ -62,14 +88,16 @@ def decrypt_signature(encrypted_data: bytes) -> bytes:
     Decrypt signature data.
 
     Args:
-        encrypted_data: Encrypted signature data
+        encrypted_data: Encrypted signature data (AES-GCM or legacy Fernet)
 
     Returns:
         Decrypted raw data
     """
-    key = get_encryption_key()
-    f = Fernet(key)
-    return f.decrypt(encrypted_data)
+    if encrypted_data[:1] != AESGCM_VERSION:
+        return get_fernet().decrypt(encrypted_data)
+
+    nonce = encrypted_data[1:1 + NONCE_SIZE]
+    return get_aesgcm().decrypt(nonce, encrypted_data[1 + NONCE_SIZE:], None)
 
 
 def encode_base64_to_bytes(base64_data: str) -> bytes:
@@ -82,9 +110,10 @@ def encode_base64_to_bytes(base64_data: str) -> bytes:
     Returns:
         Raw bytes
     """
-    # Remove data URL prefix if present
-    if ',' in base64_data:
-        base64_data = base64_data.split(',')[1]
+    # Remove data URL prefix if present (single scan, no list of parts)
+    idx = base64_data.find(',')
+    if idx != -1:
+        base64_data = base64_data[idx + 1:]
 
     return base64.b64decode(base64_data)
 
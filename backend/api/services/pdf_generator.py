@@ -8,9 +8,15 @@ matching the official Walloon Government layout.
 from io import BytesIO
 from datetime import date, time
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
+import hashlib
 import logging
 
+from cachetools import LRUCache
+from PIL import Image
+
+from reportlab import rl_config
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -25,40 +31,155 @@ from django.core.files.base import ContentFile
 
 logger = logging.getLogger(__name__)
 
+try:
+    import _rl_accel  # noqa: F401  (C helpers picked up by reportlab.lib.rl_accel)
+except ImportError:
+    logger.warning("ReportLab C accelerator not installed (reportlab[accel]); PDF rendering uses the pure Python fallback")
+
+# Embed images as binary Flate streams rather than ASCII85 text
+rl_config.useA85 = 0
+
+# Decoded client signatures, keyed by a hash of the encrypted blob
+_signature_cache = LRUCache(maxsize=128)
+
+# Largest signature embedded in the PDF (the 51 x 21 mm box at ~300 dpi)
+SIGNATURE_MAX_PIXELS = (600, 300)
+
 
 # Page dimensions
 PAGE_WIDTH, PAGE_HEIGHT = A4  # 210mm x 297mm
 
+# Fonts used by the form
+FONT_NAME = "Helvetica"
+FONT_NAME_BOLD = "Helvetica-Bold"
+
+# Trip details table row labels (values are drawn per order)
+TRIP_ROW_LABELS = (
+    "Date :",
+    "Heure",
+    "Lieu de départ :",
+    "Destination :",
+    "Prix convenu par personne :",
+)
+
+# Name of the form XObject holding the static part of the form
+BLANK_FORM_NAME = "annex9_blank"
+
+
+# Bump whenever a change to the drawing code changes the rendered output
+LAYOUT_VERSION = 1
+
+# Order attributes the rendered document depends on
+RENDERED_FIELDS = (
+    "reference",
+    "reservation_date",
+    "reservation_number",
+    "operator_title",
+    "operator_name",
+    "operator_address",
+    "operator_address_number",
+    "operator_postal_code",
+    "operator_locality",
+    "operator_bce_number",
+    "operator_authorization_number",
+    "operator_authorization_date",
+    "client_title",
+    "client_name",
+    "client_address",
+    "client_address_number",
+    "client_postal_code",
+    "client_locality",
+    "client_phone",
+    "client_gsm",
+    "passengers_adult",
+    "passengers_child",
+    "service_type",
+    "aller_date",
+    "aller_time",
+    "aller_departure",
+    "aller_destination",
+    "aller_price",
+    "retour_date",
+    "retour_time",
+    "retour_departure",
+    "retour_destination",
+    "retour_price",
+    "client_signature",
+)
+
+
+class _Layout:
+    """Precomputed page coordinates (points) of the per-order values."""
+
+    LEFT = 20 * mm
+    RIGHT = PAGE_WIDTH - 20 * mm
+    TOP = PAGE_HEIGHT - 15 * mm
+    CENTER = PAGE_WIDTH / 2
+
+    VALUE_X = LEFT + 55 * mm
+    RESERVATION_NUMBER_X = CENTER + 50 * mm
+    ADDRESS_NUMBER_X = RIGHT - 18 * mm
+    POSTAL_CODE_X = LEFT + 40 * mm
+    LOCALITY_X = LEFT + 82 * mm
+    BCE_X = LEFT + 95 * mm
+    AUTHORIZATION_X = LEFT + 115 * mm
+    AUTHORIZATION_DATE_X = LEFT + 90 * mm
+    CLIENT_ADDRESS_X = LEFT + 58 * mm
+    PHONE_X = LEFT + 18 * mm
+    GSM_X = LEFT + 75 * mm
+    CHILDREN_X = LEFT + 110 * mm
+
+    # Checkbox x position for each service type
+    SERVICE_CHECKBOX_X = {
+        "aller": LEFT + 30 * mm,
+        "retour": LEFT + 55 * mm,
+        "aller_retour": LEFT + 85 * mm,
+    }
+
+
+@lru_cache(maxsize=256)
+def _sw(text: str, font_name: str, font_size: float) -> float:
+    """Memoized pdfmetrics.stringWidth; the form only measures a few fixed strings."""
+    return pdfmetrics.stringWidth(text, font_name, font_size)
+
 
 def format_date(d: Optional[date]) -> str:
     """Format date as DD/MM/YYYY."""
     if d:
-        return d.strftime("%d/%m/%Y")
+        return f"{d.day:02d}/{d.month:02d}/{d.year:04d}"
     return ""
 
 
 def format_time(t: Optional[time]) -> str:
     """Format time as HH:MM."""
     if t:
-        return t.strftime("%H:%M")
+        return f"{t.hour:02d}:{t.minute:02d}"
     return ""
 
 
+_PRICE_FORMAT = "{:.2f} €".format
+
+
 def format_price(p: Optional[Decimal]) -> str:
     """Format price with currency."""
     if p is not None:
-        return f"{p:.2f} €"
+        return _PRICE_FORMAT(p)
     return ""
 
 
-def draw_checkbox(c: canvas.Canvas, x: float, y: float, checked: bool = False, size: float = 3*mm):
+def draw_checkbox(c: canvas.Canvas, x: float, y: float, checked: bool = False, size: float = 3*mm) -> None:
     """Draw a checkbox (circle) with optional check mark."""
     c.circle(x + size/2, y + size/2, size/2, stroke=1, fill=0)
     if checked:
-        c.circle(x + size/2, y + size/2, size/3, stroke=0, fill=1)
+        fill_checkbox(c, x, y, size)
 
 
-def draw_title_options(c: canvas.Canvas, x: float, y: float, selected_title: str, font_name: str = "Helvetica", font_size: int = 9):
+def fill_checkbox(c: canvas.Canvas, x: float, y: float, size: float = 3*mm) -> None:
+    """Draw the check mark of a checkbox drawn with draw_checkbox."""
+    c.circle(x + size/2, y + size/2, size/3, stroke=0, fill=1)
+
+
+def draw_title_options(c: canvas.Canvas, x: float, y: float, selected_title: str, font_name: str = FONT_NAME, font_size: int = 9) -> float:
     """
     Draw title options (Madame / Monsieur / Société) with strikethrough on non-selected options.
 
@@ -70,36 +191,97 @@ def draw_title_options(c: canvas.Canvas, x: float, y: float, selected_title: str
         font_name: Font to use
         font_size: Font size
     """
+    current_x = draw_title_labels(c, x, y, font_name, font_size)
+    strike_title_options(c, x, y, selected_title, font_name, font_size)
+    return current_x  # Return ending x position
+
+
+@lru_cache(maxsize=8)
+def _title_offsets(font_name: str, font_size: float) -> dict:
+    """Map each title to its (x offset, width) in the "Madame / Monsieur / Société" run."""
+    w_madame = _sw("Madame", font_name, font_size)
+    w_monsieur = _sw("Monsieur", font_name, font_size)
+    w_societe = _sw("Société", font_name, font_size)
+    w_sep = _sw(" / ", font_name, font_size)
+    return {
+        "Madame": (0, w_madame),
+        "Monsieur": (w_madame + w_sep, w_monsieur),
+        "Société": (w_madame + w_sep + w_monsieur + w_sep, w_societe),
+    }
+
+
+def draw_title_labels(c: canvas.Canvas, x: float, y: float, font_name: str = FONT_NAME, font_size: int = 9) -> float:
+    """Draw the "Madame / Monsieur / Société" labels without any strikethrough."""
     c.setFont(font_name, font_size)
 
-    titles = ["Madame", "Monsieur", "Société"]
-    separators = [" / ", " / ", ""]
+    offsets = _title_offsets(font_name, font_size)
+    x_madame, w_madame = offsets["Madame"]
+    x_monsieur, w_monsieur = offsets["Monsieur"]
+    x_societe, w_societe = offsets["Société"]
+
+    c.drawString(x + x_madame, y, "Madame")
+    c.drawString(x + x_madame + w_madame, y, " / ")
+    c.drawString(x + x_monsieur, y, "Monsieur")
+    c.drawString(x + x_monsieur + w_monsieur, y, " / ")
+    c.drawString(x + x_societe, y, "Société")
 
-    current_x = x
-    for i, title in enumerate(titles):
-        text_width = c.stringWidth(title, font_name, font_size)
+    return x + x_societe + w_societe  # Return ending x position
 
-        # Draw the title text
-        c.drawString(current_x, y, title)
 
-        # If not selected, draw strikethrough line
+def strike_title_options(c: canvas.Canvas, x: float, y: float, selected_title: str, font_name: str = FONT_NAME, font_size: int = 9) -> None:
+    """Strike through the title labels drawn by draw_title_labels, except the selected one."""
+    # Draw line through middle of text, slightly above baseline
+    line_y = y + font_size * 0.3
+    for title, (x_offset, width) in _title_offsets(font_name, font_size).items():
         if title != selected_title:
-            # Draw line through middle of text
-            line_y = y + font_size * 0.3  # Slightly above baseline
-            c.line(current_x, line_y, current_x + text_width, line_y)
+            c.line(x + x_offset, line_y, x + x_offset + width, line_y)
 
-        current_x += text_width
 
-        # Draw separator
-        if separators[i]:
-            sep_width = c.stringWidth(separators[i], font_name, font_size)
-            c.drawString(current_x, y, separators[i])
-            current_x += sep_width
+def init_render_worker() -> None:
+    """
+    Process initializer for PDF render workers.
 
-    return current_x  # Return ending x position
+    Sets up Django, then loads the font metrics so the first render in each
+    worker does not pay for them.
+    """
+    import django
+
+    django.setup()
+    for font_name in (FONT_NAME, FONT_NAME_BOLD):
+        pdfmetrics.getFont(font_name)
+
+
+def _load_signature(encrypted: bytes | memoryview) -> ImageReader:
+    """Decrypt and decode a stored signature, reusing recent results."""
+    if not isinstance(encrypted, bytes):
+        encrypted = bytes(encrypted)
+    key = hashlib.blake2b(encrypted, digest_size=16).digest()
+
+    reader = _signature_cache.get(key)
+    if reader is None:
+        from api.services.crypto import decrypt_signature
+
+        # Downsample to about 300 dpi for the signature box; thumbnail() never upscales
+        image = Image.open(BytesIO(decrypt_signature(encrypted)))
+        image.thumbnail(SIGNATURE_MAX_PIXELS, Image.LANCZOS)
+        reader = ImageReader(image)
+        _signature_cache[key] = reader
+    return reader
 
 
-def generate_annex9_pdf(order) -> BytesIO:
+def content_hash(order) -> str:
+    """Digest of everything the rendered PDF depends on; equal digests render equal PDFs."""
+    digest = hashlib.blake2b(str(LAYOUT_VERSION).encode(), digest_size=16)
+    for name in RENDERED_FIELDS:
+        value = getattr(order, name)
+        if isinstance(value, memoryview):
+            value = bytes(value)
+        digest.update(b"\0")
+        digest.update(value if isinstance(value, bytes) else repr(value).encode())
+    return digest.hexdigest()
+
+
+def generate_annex9_pdf(order) -> ContentFile:
     """
     Generate the Annex 9 PDF document for a given order.
 
@@ -107,33 +289,114 @@ def generate_annex9_pdf(order) -> BytesIO:
         order: Order model instance
 
     Returns:
-        BytesIO buffer containing the PDF
+        ContentFile containing the PDF
     """
-    buffer = BytesIO()
-    c = canvas.Canvas(buffer, pagesize=A4)
+    return ContentFile(render_annex9_pdf(order))
+
+
+def render_annex9_pdf(order) -> bytes:
+    """
+    Render the Annex 9 PDF document for a given order.
+
+    Module-level and free of database access so it can run in a worker process.
+
+    Args:
+        order: Order model instance
+
+    Returns:
+        PDF bytes
+    """
+    c = _new_canvas(f"Bon de commande - {order.reference}")
+    _draw_annex9_page(c, order, _define_blank_form(c))
+
+    # Serialize without writing through an intermediate buffer
+    return c.getpdfdata()
+
+
+def render_annex9_pdf_batch(orders: Iterable) -> bytes:
+    """
+    Render several orders as the pages of one PDF document.
+
+    The document setup, font resources, cross-reference table and the static
+    form (a single form XObject) are shared by all pages instead of being
+    rebuilt per order.
+
+    Args:
+        orders: Order model instances, in page order
+
+    Returns:
+        PDF bytes
+    """
+    c = _new_canvas("Bons de commande")
+    pos = _define_blank_form(c)
+    for order in orders:
+        _draw_annex9_page(c, order, pos)
+        c.showPage()
+    return c.getpdfdata()
+
+
+def _new_canvas(title: str) -> canvas.Canvas:
+    """Create an A4 canvas with the document metadata set."""
+    # No output file: the bytes are taken straight from getpdfdata()
+    c = canvas.Canvas(None, pagesize=A4, pageCompression=1)
 
     # Set document metadata
-    c.setTitle(f"Bon de commande - {order.reference}")
+    c.setTitle(title)
     c.setAuthor("Annex 9 Generator")
     c.setSubject("Bon de commande d'un service de taxis collectifs")
     c.setCreator("Annex 9 Generator v1.0")
+    return c
+
+
+def _draw_annex9_page(c: canvas.Canvas, order, pos: dict) -> None:
+    """Draw one order's Annex 9 form on the current page."""
+    c.doForm(BLANK_FORM_NAME)
+    _draw_order_fields(c, order, pos)
+
+
+def _define_blank_form(c: canvas.Canvas) -> dict:
+    """
+    Draw the static part of the form once per document, as a form XObject.
+
+    Every page then references it with doForm instead of repeating its
+    drawing operators.
+
+    Returns:
+        Positions of the variable fields, used by _draw_order_fields
+    """
+    c.beginForm(BLANK_FORM_NAME)
+    pos = _draw_blank_form(c)
+    c.endForm()
+    return pos
+
+
+def _draw_blank_form(c: canvas.Canvas) -> dict:
+    """
+    Draw every label, box and line of the form that does not depend on the order.
+
+    Returns:
+        Positions of the variable fields, used by _draw_order_fields
+    """
+    pos = {}
+    # Field underlines, stroked together at the end
+    underlines = []
 
     # Margins
-    left_margin = 20 * mm
-    right_margin = PAGE_WIDTH - 20 * mm
-    top_margin = PAGE_HEIGHT - 15 * mm
+    left_margin = _Layout.LEFT
+    right_margin = _Layout.RIGHT
+    top_margin = _Layout.TOP
 
     # Current Y position (starts from top)
     y = top_margin
 
     # ============== HEADER ==============
     # "Annexe 9" at top center (Note: Form shows "Annexe 5" but spec says Annex 9)
-    c.setFont("Helvetica-Bold", 10)
+    c.setFont(FONT_NAME_BOLD, 10)
     c.drawCentredString(PAGE_WIDTH / 2, y, "Annexe 9")
     y -= 12
 
     # Legal reference text
-    c.setFont("Helvetica", 8)
+    c.setFont(FONT_NAME, 8)
     legal_text = (
         "Annexe 9 de l'arrêté du Gouvernement wallon du 3 juin 2009 portant exécution du décret du 18 octobre 2007 relatif aux services de "
     )
@@ -143,175 +406,147 @@ def generate_annex9_pdf(order) -> BytesIO:
     y -= 20
 
     # Title
-    c.setFont("Helvetica-Bold", 14)
+    c.setFont(FONT_NAME_BOLD, 14)
     c.drawCentredString(PAGE_WIDTH / 2, y, "Bon de commande d'un service de taxis collectifs")
     y -= 25
 
     # ============== CACHET DE L'EXPLOITANT ==============
-    c.setFont("Helvetica-Bold", 9)
+    c.setFont(FONT_NAME_BOLD, 9)
     c.drawString(left_margin, y, "(CACHET DE L'EXPLOITANT)")
     y -= 35
 
     # ============== RESERVATION BOX ==============
-    box_top = y + 5
     box_height = 20
     c.rect(left_margin, y - box_height + 5, right_margin - left_margin, box_height)
 
-    c.setFont("Helvetica-Bold", 9)
+    c.setFont(FONT_NAME_BOLD, 9)
     c.drawString(left_margin + 5, y - 5, "Date de réservation :")
-    c.setFont("Helvetica", 9)
-    c.drawString(left_margin + 55 * mm, y - 5, format_date(order.reservation_date))
-
-    c.setFont("Helvetica-Bold", 9)
     c.drawString(PAGE_WIDTH / 2 + 10, y - 5, "N° de réservation :")
-    c.setFont("Helvetica", 9)
-    c.drawString(PAGE_WIDTH / 2 + 50 * mm, y - 5, order.reservation_number or order.reference)
+    pos["reservation"] = y - 5
 
     y -= 35
 
     # ============== EXPLOITANT SECTION ==============
-    c.setFont("Helvetica-Bold", 10)
+    c.setFont(FONT_NAME_BOLD, 10)
     c.setFillColorRGB(0, 0, 0)
     c.drawString(left_margin, y, "Exploitant:")
-    c.line(left_margin, y - 2, left_margin + 25 * mm, y - 2)
+    underlines.append((left_margin, y - 2, left_margin + 25 * mm, y - 2))
     y -= 20
 
     # Operator fields
-    c.setFont("Helvetica", 9)
+    c.setFont(FONT_NAME, 9)
 
-    # Name with title options (strikethrough non-selected)
+    # Name with title options (struck through per order)
     c.drawString(left_margin, y, "Nom : ")
-    title_x = left_margin + c.stringWidth("Nom : ", "Helvetica", 9)
-    operator_title = getattr(order, 'operator_title', None) or 'Société'
-    draw_title_options(c, title_x, y, operator_title)
-    c.setFont("Helvetica", 9)
-    name_x = left_margin + 55 * mm
-    c.drawString(name_x, y, order.operator_name)
-    c.line(name_x, y - 2, right_margin, y - 2)
+    pos["operator_title_x"] = left_margin + _sw("Nom : ", FONT_NAME, 9)
+    draw_title_labels(c, pos["operator_title_x"], y)
+    c.setFont(FONT_NAME, 9)
+    underlines.append((left_margin + 55 * mm, y - 2, right_margin, y - 2))
+    pos["operator_name"] = y
     y -= 16
 
     # Address
     c.drawString(left_margin, y, "Adresse : domicile/siège social situé")
-    addr_x = left_margin + 55 * mm
-    c.drawString(addr_x, y, order.operator_address)
-    c.line(addr_x, y - 2, right_margin - 30 * mm, y - 2)
+    underlines.append((left_margin + 55 * mm, y - 2, right_margin - 30 * mm, y - 2))
     c.drawString(right_margin - 25 * mm, y, "n°")
-    c.drawString(right_margin - 18 * mm, y, order.operator_address_number or "")
-    c.line(right_margin - 18 * mm, y - 2, right_margin, y - 2)
+    underlines.append((right_margin - 18 * mm, y - 2, right_margin, y - 2))
+    pos["operator_address"] = y
     y -= 16
 
     # Postal code and locality
     c.drawString(left_margin + 15 * mm, y, "code postal :")
-    c.drawString(left_margin + 40 * mm, y, order.operator_postal_code)
-    c.line(left_margin + 40 * mm, y - 2, left_margin + 60 * mm, y - 2)
+    underlines.append((left_margin + 40 * mm, y - 2, left_margin + 60 * mm, y - 2))
     c.drawString(left_margin + 65 * mm, y, "localité :")
-    c.drawString(left_margin + 82 * mm, y, order.operator_locality)
-    c.line(left_margin + 82 * mm, y - 2, right_margin, y - 2)
+    underlines.append((left_margin + 82 * mm, y - 2, right_margin, y - 2))
+    pos["operator_postal"] = y
     y -= 16
 
     # BCE number
     c.drawString(left_margin, y, "inscrit(e) à la banque carrefour des entreprises sous le numéro")
-    bce_x = left_margin + 95 * mm
-    c.drawString(bce_x, y, order.operator_bce_number or "")
-    c.line(bce_x, y - 2, right_margin, y - 2)
+    underlines.append((left_margin + 95 * mm, y - 2, right_margin, y - 2))
+    pos["operator_bce"] = y
     y -= 16
 
     # Authorization
     c.drawString(left_margin, y, "exploitant un service de taxis collectifs en vertu d'une autorisation portant le n°")
-    auth_x = left_margin + 115 * mm
-    c.drawString(auth_x, y, order.operator_authorization_number or "")
-    c.line(auth_x, y - 2, right_margin, y - 2)
+    underlines.append((left_margin + 115 * mm, y - 2, right_margin, y - 2))
+    pos["operator_authorization"] = y
     y -= 16
 
     c.drawString(left_margin, y, "délivrée par les services du Gouvernement wallon en date du")
-    date_x = left_margin + 90 * mm
-    c.drawString(date_x, y, format_date(order.operator_authorization_date))
-    c.line(date_x, y - 2, right_margin, y - 2)
+    underlines.append((left_margin + 90 * mm, y - 2, right_margin, y - 2))
+    pos["operator_authorization_date"] = y
     y -= 28
 
     # ============== CLIENT SECTION ==============
     # Box around client section
-    client_box_top = y + 8
     client_box_height = 85
     c.rect(left_margin, y - client_box_height + 8, right_margin - left_margin, client_box_height)
 
-    c.setFont("Helvetica-Bold", 10)
+    c.setFont(FONT_NAME_BOLD, 10)
     c.drawString(left_margin + 3, y, "Client :")
-    c.line(left_margin + 3, y - 2, left_margin + 20 * mm, y - 2)
+    underlines.append((left_margin + 3, y - 2, left_margin + 20 * mm, y - 2))
     y -= 20
 
-    c.setFont("Helvetica", 9)
+    c.setFont(FONT_NAME, 9)
 
-    # Client name with title options (strikethrough non-selected)
+    # Client name with title options (struck through per order)
     c.drawString(left_margin + 3, y, "Nom : ")
-    title_x = left_margin + 3 + c.stringWidth("Nom : ", "Helvetica", 9)
-    client_title = getattr(order, 'client_title', None) or 'Monsieur'
-    draw_title_options(c, title_x, y, client_title)
-    c.setFont("Helvetica", 9)
-    name_x = left_margin + 55 * mm
-    c.drawString(name_x, y, order.client_name)
-    c.line(name_x, y - 2, right_margin - 3, y - 2)
+    pos["client_title_x"] = left_margin + 3 + _sw("Nom : ", FONT_NAME, 9)
+    draw_title_labels(c, pos["client_title_x"], y)
+    c.setFont(FONT_NAME, 9)
+    underlines.append((left_margin + 55 * mm, y - 2, right_margin - 3, y - 2))
+    pos["client_name"] = y
     y -= 16
 
     # Client address
     c.drawString(left_margin + 3, y, "Adresse : domicile / siège social situé")
-    addr_x = left_margin + 58 * mm
-    c.drawString(addr_x, y, order.client_address)
-    c.line(addr_x, y - 2, right_margin - 30 * mm, y - 2)
+    underlines.append((left_margin + 58 * mm, y - 2, right_margin - 30 * mm, y - 2))
     c.drawString(right_margin - 25 * mm, y, "n°")
-    c.drawString(right_margin - 18 * mm, y, order.client_address_number or "")
-    c.line(right_margin - 18 * mm, y - 2, right_margin - 3, y - 2)
+    underlines.append((right_margin - 18 * mm, y - 2, right_margin - 3, y - 2))
+    pos["client_address"] = y
     y -= 16
 
     # Postal code and locality
     c.drawString(left_margin + 15 * mm, y, "code postal :")
-    c.drawString(left_margin + 40 * mm, y, order.client_postal_code)
-    c.line(left_margin + 40 * mm, y - 2, left_margin + 60 * mm, y - 2)
+    underlines.append((left_margin + 40 * mm, y - 2, left_margin + 60 * mm, y - 2))
     c.drawString(left_margin + 65 * mm, y, "localité :")
-    c.drawString(left_margin + 82 * mm, y, order.client_locality)
-    c.line(left_margin + 82 * mm, y - 2, right_margin - 3, y - 2)
+    underlines.append((left_margin + 82 * mm, y - 2, right_margin - 3, y - 2))
+    pos["client_postal"] = y
     y -= 16
 
     # Phone numbers
     c.drawString(left_margin + 3, y, "Tél :")
-    c.drawString(left_margin + 18 * mm, y, order.client_phone or "")
-    c.line(left_margin + 18 * mm, y - 2, left_margin + 55 * mm, y - 2)
+    underlines.append((left_margin + 18 * mm, y - 2, left_margin + 55 * mm, y - 2))
     c.drawString(left_margin + 60 * mm, y, "GSM :")
-    c.drawString(left_margin + 75 * mm, y, order.client_gsm or "")
-    c.line(left_margin + 75 * mm, y - 2, right_margin - 3, y - 2)
+    underlines.append((left_margin + 75 * mm, y - 2, right_margin - 3, y - 2))
+    pos["client_phone"] = y
     y -= 16
 
     # Passengers
     c.drawString(left_margin + 3, y, "Nombre de passagers : adulte :")
-    c.drawString(left_margin + 55 * mm, y, str(order.passengers_adult))
-    c.line(left_margin + 55 * mm, y - 2, left_margin + 70 * mm, y - 2)
+    underlines.append((left_margin + 55 * mm, y - 2, left_margin + 70 * mm, y - 2))
     c.drawString(left_margin + 75 * mm, y, "enfant(s) - 12 ans :")
-    c.drawString(left_margin + 110 * mm, y, str(order.passengers_child))
-    c.line(left_margin + 110 * mm, y - 2, right_margin - 3, y - 2)
+    underlines.append((left_margin + 110 * mm, y - 2, right_margin - 3, y - 2))
+    pos["passengers"] = y
     y -= 32
 
     # ============== SERVICE TYPE ==============
-    c.setFont("Helvetica-Bold", 10)
+    c.setFont(FONT_NAME_BOLD, 10)
     c.drawString(left_margin, y, "Service :")
-    c.line(left_margin, y - 2, left_margin + 20 * mm, y - 2)
+    underlines.append((left_margin, y - 2, left_margin + 20 * mm, y - 2))
 
-    c.setFont("Helvetica", 9)
+    c.setFont(FONT_NAME, 9)
     checkbox_y = y - 1
+    pos["service_checkbox"] = checkbox_y
 
-    # Aller checkbox
-    aller_x = left_margin + 30 * mm
-    draw_checkbox(c, aller_x, checkbox_y, checked=(order.service_type == "aller"))
-    c.drawString(aller_x + 5 * mm, y, "Aller")
-
-    # Retour checkbox
-    retour_x = left_margin + 55 * mm
-    draw_checkbox(c, retour_x, checkbox_y, checked=(order.service_type == "retour"))
-    c.drawString(retour_x + 5 * mm, y, "Retour")
-
-    # Aller/Retour checkbox
-    ar_x = left_margin + 85 * mm
-    draw_checkbox(c, ar_x, checkbox_y, checked=(order.service_type == "aller_retour"))
-    c.drawString(ar_x + 5 * mm, y, "Aller/Retour")
+    # Aller / Retour / Aller-Retour checkboxes (filled per order)
+    draw_checkbox(c, left_margin + 30 * mm, checkbox_y)
+    c.drawString(left_margin + 35 * mm, y, "Aller")
+    draw_checkbox(c, left_margin + 55 * mm, checkbox_y)
+    c.drawString(left_margin + 60 * mm, y, "Retour")
+    draw_checkbox(c, left_margin + 85 * mm, checkbox_y)
+    c.drawString(left_margin + 90 * mm, y, "Aller/Retour")
 
     y -= 28
 
@@ -329,92 +564,181 @@ def generate_annex9_pdf(order) -> BytesIO:
     c.rect(table_left, y - row_height, table_width, row_height, fill=1)
     c.setFillColorRGB(0, 0, 0)
 
-    c.setFont("Helvetica-Bold", 9)
+    c.setFont(FONT_NAME_BOLD, 9)
     c.drawCentredString(table_left + col1_width + col2_width / 2, y - 10, "Aller")
     c.drawCentredString(table_left + col1_width + col2_width + col3_width / 2, y - 10, "Retour")
 
-    # Draw header borders
-    c.line(table_left, y, table_left + table_width, y)
-    c.line(table_left, y - row_height, table_left + table_width, y - row_height)
-    c.line(table_left, y, table_left, y - row_height)
-    c.line(table_left + col1_width, y, table_left + col1_width, y - row_height)
-    c.line(table_left + col1_width + col2_width, y, table_left + col1_width + col2_width, y - row_height)
-    c.line(table_left + table_width, y, table_left + table_width, y - row_height)
+    # Horizontal rule of every row, header included
+    table_ys = [y - i * row_height for i in range(len(TRIP_ROW_LABELS) + 2)]
 
     y -= row_height
 
     # Table rows
-    rows = [
-        ("Date :", format_date(order.aller_date), format_date(order.retour_date)),
-        ("Heure", format_time(order.aller_time), format_time(order.retour_time)),
-        ("Lieu de départ :", order.aller_departure or "", order.retour_departure or ""),
-        ("Destination :", order.aller_destination or "", order.retour_destination or ""),
-        ("Prix convenu par personne :", format_price(order.aller_price), format_price(order.retour_price)),
-    ]
-
-    c.setFont("Helvetica", 9)
-    for label, aller_val, retour_val in rows:
+    pos["table_aller_x"] = table_left + col1_width + col2_width / 2
+    pos["table_retour_x"] = table_left + col1_width + col2_width + col3_width / 2
+    pos["table_rows"] = []
+
+    c.setFont(FONT_NAME, 9)
+    for label in TRIP_ROW_LABELS:
         # Draw row
         c.drawString(table_left + 3, y - 10, label)
-        c.drawCentredString(table_left + col1_width + col2_width / 2, y - 10, aller_val)
-        c.drawCentredString(table_left + col1_width + col2_width + col3_width / 2, y - 10, retour_val)
-
-        # Row borders
-        c.line(table_left, y - row_height, table_left + table_width, y - row_height)
-        c.line(table_left, y, table_left, y - row_height)
-        c.line(table_left + col1_width, y, table_left + col1_width, y - row_height)
-        c.line(table_left + col1_width + col2_width, y, table_left + col1_width + col2_width, y - row_height)
-        c.line(table_left + table_width, y, table_left + table_width, y - row_height)
-
+        pos["table_rows"].append(y - 10)
         y -= row_height
 
+    # All table borders in a single path
+    c.grid(
+        [table_left, table_left + col1_width, table_left + col1_width + col2_width, table_left + table_width],
+        table_ys,
+    )
+
     y -= 20
 
     # ============== SIGNATURES ==============
-    c.setFont("Helvetica", 9)
+    c.setFont(FONT_NAME, 9)
 
     # Signature box dimensions
     sig_box_width = 55 * mm
     sig_box_height = 25 * mm
 
     # Operator signature (left side)
-    op_label_x = left_margin
-    c.drawString(op_label_x, y, "Signature de l'exploitant :")
+    c.drawString(left_margin, y, "Signature de l'exploitant :")
     # Operator signature box
-    op_box_x = left_margin
     op_box_y = y - sig_box_height - 5
-    c.rect(op_box_x, op_box_y, sig_box_width, sig_box_height)
+    c.rect(left_margin, op_box_y, sig_box_width, sig_box_height)
 
     # Client signature (right side)
     client_label_x = PAGE_WIDTH / 2 + 10 * mm
     c.drawString(client_label_x, y, "Signature du client")
     y -= 10
-    c.setFont("Helvetica", 7)
+    c.setFont(FONT_NAME, 7)
     c.drawString(client_label_x, y, "(au plus tard au moment de la prise en charge) :")
 
-    # Client signature box
+    # Client signature box (same Y as operator box)
     client_box_x = PAGE_WIDTH / 2 + 10 * mm
-    client_box_y = op_box_y  # Same Y as operator box
-    c.rect(client_box_x, client_box_y, sig_box_width, sig_box_height)
+    c.rect(client_box_x, op_box_y, sig_box_width, sig_box_height)
+
+    # Signature image area inside the box with padding
+    padding = 2 * mm
+    pos["signature_box"] = (
+        client_box_x + padding,
+        op_box_y + padding,
+        sig_box_width - (2 * padding),
+        sig_box_height - (2 * padding),
+    )
 
-    # Draw client signature image if exists
-    if order.client_signature:
-        try:
-            from api.services.crypto import decrypt_signature
+    y = op_box_y - 15  # Move below the signature boxes
+
+    # ============== FOOTER - LEGAL TEXT ==============
+    footer_text_1 = "Vu pour être annexé à l'arrêté du Gouvernement wallon du 11 juillet 2013 modifiant l'arrêté du Gouvernement wallon"
+    footer_text_2 = "du 3 juin 2009 portant exécution du décret du 18 octobre 2007 relatif aux services de taxis et aux services de location"
+    footer_text_3 = "de voitures avec chauffeur"
+
+    # One text object for the whole legal block
+    t = c.beginText(left_margin, y)
+    t.setFont(FONT_NAME, 7, leading=9)
+    t.textLine(footer_text_1)
+    t.textLine(footer_text_2)
+    t.textLine(footer_text_3)
+    t.moveCursor(0, 5)
+    t.textLine("Namur, le 11 juillet 2013.")
+    c.drawText(t)
+    y -= 3 * 9 + 5  # baseline of the "Namur" line
+    y -= 14
+
+    # Ministers: centred lines, one text object per column
+    minister_columns = (
+        (left_margin + 40 * mm, ("Le Ministre-Président,", "R. DEMOTTE,")),
+        (
+            right_margin - 45 * mm,
+            ("Le Ministre de l'Environnement, de l'Aménagement", "du Territoire et de la Mobilité,", "P. HENRY"),
+        ),
+    )
+    for center_x, lines in minister_columns:
+        t = c.beginText()
+        t.setFont(FONT_NAME, 8)
+        for i, line in enumerate(lines):
+            t.setTextOrigin(center_x - _sw(line, FONT_NAME, 8) / 2, y - i * 9)
+            t.textOut(line)
+        c.drawText(t)
+
+    c.lines(underlines)
+
+    return pos
+
+
+def _draw_order_fields(c: canvas.Canvas, order, pos: dict) -> None:
+    """Draw the order's values onto the blank form."""
+    c.setFont(FONT_NAME, 9)
+
+    # ============== RESERVATION BOX ==============
+    y = pos["reservation"]
+    c.drawString(_Layout.VALUE_X, y, format_date(order.reservation_date))
+    c.drawString(_Layout.RESERVATION_NUMBER_X, y, order.reservation_number or order.reference)
 
-            # Decrypt the signature
-            decrypted_data = decrypt_signature(bytes(order.client_signature))
+    # ============== EXPLOITANT SECTION ==============
+    y = pos["operator_name"]
+    operator_title = order.operator_title or 'Société'
+    strike_title_options(c, pos["operator_title_x"], y, operator_title)
+    c.drawString(_Layout.VALUE_X, y, order.operator_name)
+
+    y = pos["operator_address"]
+    c.drawString(_Layout.VALUE_X, y, order.operator_address)
+    c.drawString(_Layout.ADDRESS_NUMBER_X, y, order.operator_address_number or "")
+
+    y = pos["operator_postal"]
+    c.drawString(_Layout.POSTAL_CODE_X, y, order.operator_postal_code)
+    c.drawString(_Layout.LOCALITY_X, y, order.operator_locality)
+
+    c.drawString(_Layout.BCE_X, pos["operator_bce"], order.operator_bce_number or "")
+    c.drawString(_Layout.AUTHORIZATION_X, pos["operator_authorization"], order.operator_authorization_number or "")
+    c.drawString(_Layout.AUTHORIZATION_DATE_X, pos["operator_authorization_date"], format_date(order.operator_authorization_date))
+
+    # ============== CLIENT SECTION ==============
+    y = pos["client_name"]
+    client_title = order.client_title or 'Monsieur'
+    strike_title_options(c, pos["client_title_x"], y, client_title)
+    c.drawString(_Layout.VALUE_X, y, order.client_name)
+
+    y = pos["client_address"]
+    c.drawString(_Layout.CLIENT_ADDRESS_X, y, order.client_address)
+    c.drawString(_Layout.ADDRESS_NUMBER_X, y, order.client_address_number or "")
+
+    y = pos["client_postal"]
+    c.drawString(_Layout.POSTAL_CODE_X, y, order.client_postal_code)
+    c.drawString(_Layout.LOCALITY_X, y, order.client_locality)
 
-            # Create image from decrypted bytes
-            signature_image = ImageReader(BytesIO(decrypted_data))
+    y = pos["client_phone"]
+    c.drawString(_Layout.PHONE_X, y, order.client_phone or "")
+    c.drawString(_Layout.GSM_X, y, order.client_gsm or "")
 
-            # Draw signature image inside the box with padding
-            padding = 2 * mm
-            sig_img_width = sig_box_width - (2 * padding)
-            sig_img_height = sig_box_height - (2 * padding)
-            sig_img_x = client_box_x + padding
-            sig_img_y = client_box_y + padding
+    y = pos["passengers"]
+    c.drawString(_Layout.VALUE_X, y, str(order.passengers_adult))
+    c.drawString(_Layout.CHILDREN_X, y, str(order.passengers_child))
+
+    # ============== SERVICE TYPE ==============
+    checkbox_x = _Layout.SERVICE_CHECKBOX_X.get(order.service_type)
+    if checkbox_x is not None:
+        fill_checkbox(c, checkbox_x, pos["service_checkbox"])
+
+    # ============== TRIP DETAILS TABLE ==============
+    rows = (
+        (format_date(order.aller_date), format_date(order.retour_date)),
+        (format_time(order.aller_time), format_time(order.retour_time)),
+        (order.aller_departure or "", order.retour_departure or ""),
+        (order.aller_destination or "", order.retour_destination or ""),
+        (format_price(order.aller_price), format_price(order.retour_price)),
+    )
+    for row_y, (aller_val, retour_val) in zip(pos["table_rows"], rows):
+        c.drawCentredString(pos["table_aller_x"], row_y, aller_val)
+        c.drawCentredString(pos["table_retour_x"], row_y, retour_val)
+
+    # ============== SIGNATURES ==============
+    # Draw client signature image if exists
+    if order.client_signature:
+        try:
+            signature_image = _load_signature(order.client_signature)
 
+            sig_img_x, sig_img_y, sig_img_width, sig_img_height = pos["signature_box"]
             c.drawImage(
                 signature_image,
                 sig_img_x,
@@ -426,36 +750,3 @@ def generate_annex9_pdf(order) -> BytesIO:
             )
         except Exception as e:
             logger.warning(f"Could not add client signature to PDF: {e}")
-
-    y = op_box_y - 15  # Move below the signature boxes
-
-    # ============== FOOTER - LEGAL TEXT ==============
-    c.setFont("Helvetica", 7)
-    footer_text_1 = "Vu pour être annexé à l'arrêté du Gouvernement wallon du 11 juillet 2013 modifiant l'arrêté du Gouvernement wallon"
-    footer_text_2 = "du 3 juin 2009 portant exécution du décret du 18 octobre 2007 relatif aux services de taxis et aux services de location"
-    footer_text_3 = "de voitures avec chauffeur"
-
-    c.drawString(left_margin, y, footer_text_1)
-    y -= 9
-    c.drawString(left_margin, y, footer_text_2)
-    y -= 9
-    c.drawString(left_margin, y, footer_text_3)
-    y -= 14
-
-    c.drawString(left_margin, y, "Namur, le 11 juillet 2013.")
-    y -= 14
-
-    # Ministers
-    c.setFont("Helvetica", 8)
-    c.drawCentredString(left_margin + 40 * mm, y, "Le Ministre-Président,")
-    c.drawCentredString(right_margin - 45 * mm, y, "Le Ministre de l'Environnement, de l'Aménagement")
-    y -= 9
-    c.drawCentredString(left_margin + 40 * mm, y, "R. DEMOTTE,")
-    c.drawCentredString(right_margin - 45 * mm, y, "du Territoire et de la Mobilité,")
-    y -= 9
-    c.drawCentredString(right_margin - 45 * mm, y, "P. HENRY")
-
-    # Save and return
-    c.save()
-    buffer.seek(0)
-    return ContentFile(buffer.getvalue())
@@ -11,23 +11,15 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 # Initialize Django first
 django_asgi_app = get_asgi_application()
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from starlette.routing import Mount
-from django.conf import settings
-
 from api.main import app as fastapi_app
 
 
 # Create combined ASGI application
 async def application(scope, receive, send):
-    if scope["type"] == "http":
-        path = scope.get("path", "")
-        # Route /api/* requests to FastAPI
-        if path.startswith("/api"):
-            await fastapi_app(scope, receive, send)
-        else:
-            # Route everything else to Django
-            await django_asgi_app(scope, receive, send)
+    # Route /api/* requests to FastAPI; Django does not handle lifespan, so
+    # FastAPI also runs the startup hooks. Everything else goes to Django.
+    scope_type = scope["type"]
+    if scope_type == "lifespan" or (scope_type == "http" and scope["path"].startswith("/api")):
+        await fastapi_app(scope, receive, send)
     else:
         await django_asgi_app(scope, receive, send)
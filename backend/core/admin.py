@@ -2,10 +2,20 @@
 Django Admin configuration for Annex 9 Generator.
 """
 
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.contrib.admin.views.main import ChangeList
+from django.db import transaction
+from django.forms.models import BaseInlineFormSet
+from django.http import HttpResponse
 from django.utils.html import format_html
 from .models import Order, Template, OrderAuditLog, Client, OperatorConfig
 
+# Encrypted signature blobs, only needed when a PDF is rendered
+SIGNATURE_FIELDS = ("operator_signature", "client_signature")
+
+# The export renders in the request thread, so keep the selection small
+EXPORT_PDFS_MAX_ORDERS = 50
+
 
 @admin.register(OperatorConfig)
 class OperatorConfigAdmin(admin.ModelAdmin):
@@ -33,19 +43,47 @@ class TemplateAdmin(admin.ModelAdmin):
     list_display = ["version", "name", "is_active", "created_at"]
     list_filter = ["is_active"]
     search_fields = ["version", "name"]
-    readonly_fields = ["created_at", "updated_at"]
+    readonly_fields = ["layout_hash", "created_at", "updated_at"]
+
+
+class OrderAuditLogFormSet(BaseInlineFormSet):
+    # Most recent audit rows shown on the order page
+    max_rows = 50
+
+    def get_queryset(self):
+        # Slice after the formset has filtered on the parent order
+        if not hasattr(self, "_queryset"):
+            self._queryset = super().get_queryset()[: self.max_rows]
+        return self._queryset
 
 
 class OrderAuditLogInline(admin.TabularInline):
     model = OrderAuditLog
+    formset = OrderAuditLogFormSet
     extra = 0
     readonly_fields = ["action", "user", "timestamp", "details"]
     can_delete = False
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .with_related()
+            .defer(*(f"order__{name}" for name in SIGNATURE_FIELDS))
+            .order_by("-timestamp")
+        )
+
     def has_add_permission(self, request, obj=None):
         return False
 
 
+class OrderChangeList(ChangeList):
+    def get_results(self, request):
+        # List rows never show the signatures; actions still get full rows
+        self.queryset = self.queryset.defer(*SIGNATURE_FIELDS)
+        super().get_results(request)
+
+
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
     list_display = [
@@ -63,6 +101,7 @@ class OrderAdmin(admin.ModelAdmin):
     readonly_fields = ["id", "reference", "created_at", "updated_at", "pdf_generated_at"]
     date_hierarchy = "reservation_date"
     inlines = [OrderAuditLogInline]
+    actions = ["export_pdfs"]
 
     fieldsets = (
         (
@@ -174,28 +213,81 @@ class OrderAdmin(admin.ModelAdmin):
 
     pdf_link.short_description = "PDF"
 
+    def get_changelist(self, request, **kwargs):
+        return OrderChangeList
+
+    @admin.action(description="Exporter les PDF sélectionnés")
+    def export_pdfs(self, request, queryset):
+        from api.services.pdf_generator import render_annex9_pdf_batch
+
+        # One document with a page per order, rendered on a single canvas
+        orders = queryset.defer("operator_signature").order_by("reference")
+        # One row past the cap tells an oversized selection apart without a COUNT
+        orders = list(orders[:EXPORT_PDFS_MAX_ORDERS + 1])
+        if len(orders) > EXPORT_PDFS_MAX_ORDERS:
+            self.message_user(
+                request,
+                f"Sélectionnez au plus {EXPORT_PDFS_MAX_ORDERS} bons de commande à exporter.",
+                level=messages.ERROR,
+            )
+            return None
+        response = HttpResponse(render_annex9_pdf_batch(orders), content_type="application/pdf")
+        response["Content-Disposition"] = 'attachment; filename="annex9_orders.pdf"'
+        return response
+
     def save_model(self, request, obj, form, change):
+        # Updates write only the edited columns; a full save would also
+        # rewrite the signature blobs
+        update_fields = [*form.changed_data, "updated_at"] if change else None
         if not obj.created_by:
             obj.created_by = request.user
-        super().save_model(request, obj, form, change)
+            if change:
+                update_fields.append("created_by")
+        if not change or len(update_fields) > 1:
+            obj.save(update_fields=update_fields)
+
+        # Nothing to record for an update that changed no field
+        if change and not form.changed_data:
+            return
 
         # Create audit log
         action = "updated" if change else "created"
-        OrderAuditLog.objects.create(
-            order=obj,
-            action=action,
-            user=request.user,
-            details={"changed_fields": list(form.changed_data) if change else []},
+        self._queue_audit_log(
+            request,
+            OrderAuditLog(
+                order=obj,
+                action=action,
+                user=request.user,
+                details={"changed_fields": list(form.changed_data) if change else []},
+            ),
         )
 
+    def _queue_audit_log(self, request, log):
+        """Write the audit rows of one admin request with a single INSERT on commit."""
+        if not transaction.get_connection().in_atomic_block:
+            log.save()
+            return
+
+        pending = getattr(request, "_pending_audit_logs", None)
+        if pending is None:
+            pending = request._pending_audit_logs = []
+            transaction.on_commit(lambda: OrderAuditLog.objects.bulk_create(pending))
+        pending.append(log)
+
 
 @admin.register(OrderAuditLog)
 class OrderAuditLogAdmin(admin.ModelAdmin):
     list_display = ["order", "action", "user", "timestamp"]
     list_filter = ["action", "timestamp"]
+    list_select_related = ["order", "user"]
     search_fields = ["order__reference"]
     readonly_fields = ["order", "action", "user", "timestamp", "details"]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer(
+            *(f"order__{name}" for name in SIGNATURE_FIELDS)
+        )
+
     def has_add_permission(self, request):
         return False
 
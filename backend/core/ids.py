@@ -0,0 +1,21 @@
+"""
+Primary key generators for the core models.
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows append
+    to the right edge of the primary key index instead of landing on random
+    leaf pages. The remaining 74 bits are random.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Overwrite the version (7) and variant (0b10) bits
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
@@ -3,8 +3,22 @@ Management command to seed the initial admin and readonly users.
 """
 
 import os
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, make_password
 from django.contrib.auth.models import User
+from django.db import transaction
+
+
+def _env_flag(name):
+    """Read a boolean environment variable ("true", any case, enables it)."""
+    return os.environ.get(name, '').lower() == 'true'
+
+
+class FastSeedPasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2 with a low iteration count, for development seed users only."""
+
+    iterations = 10000
 
 
 class Command(BaseCommand):
@@ -16,44 +30,115 @@ class Command(BaseCommand):
             action='store_true',
             help='Reset password for existing user',
         )
+        # Passwords stay environment-only so they never show up in argv
+        parser.add_argument(
+            '--admin-username',
+            default=os.environ.get('ADMIN_USERNAME', 'admin'),
+            help='Admin username (default: $ADMIN_USERNAME or "admin")',
+        )
+        parser.add_argument(
+            '--admin-email',
+            default=os.environ.get('ADMIN_EMAIL', 'admin@example.com'),
+            help='Admin email (default: $ADMIN_EMAIL)',
+        )
+        parser.add_argument(
+            '--readonly-username',
+            default=os.environ.get('READONLY_USERNAME'),
+            help='Readonly username (default: $READONLY_USERNAME)',
+        )
+        parser.add_argument(
+            '--readonly-email',
+            default=os.environ.get('READONLY_EMAIL', 'readonly@example.com'),
+            help='Readonly email (default: $READONLY_EMAIL)',
+        )
 
-    def _create_or_update_user(self, username, email, password, is_staff, is_superuser, reset_password):
-        """Create or update a user."""
-        user = User.objects.filter(username=username).first()
-
-        if user:
-            if reset_password:
-                user.set_password(password)
-                user.email = email
-                user.is_staff = is_staff
-                user.is_superuser = is_superuser
-                user.save()
-                self.stdout.write(
-                    self.style.SUCCESS(f"Password reset for user: {username}")
-                )
-            else:
-                self.stdout.write(
-                    self.style.SUCCESS(f"User '{username}' already exists. Use --reset-password to update.")
-                )
+    def _hash_password(self, password):
+        """Hash a password with the fast dev hasher when enabled, else the default one."""
+        if self._fast_hasher is None:
+            return make_password(password)
+        return self._fast_hasher.encode(password, self._fast_hasher.salt())
+
+    def _make_password(self, password):
+        """Hash a password, reusing the hash of an identical one when allowed."""
+        if self._password_hashes is None:
+            return self._hash_password(password)
+        if password not in self._password_hashes:
+            self._password_hashes[password] = self._hash_password(password)
+        return self._password_hashes[password]
+
+    def _update_user(self, username, spec, reset_password):
+        """Update an existing user."""
+        if reset_password:
+            # Single UPDATE of the changed columns, without loading the row
+            User.objects.filter(username=username).update(
+                password=self._make_password(spec["password"]),
+                email=spec["email"],
+                is_staff=spec["is_staff"],
+                is_superuser=spec["is_superuser"],
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f"Password reset for user: {username}")
+            )
         else:
-            user = User.objects.create_user(
-                username=username,
-                email=email,
-                password=password,
-                is_staff=is_staff,
-                is_superuser=is_superuser,
+            self.stdout.write(
+                self.style.SUCCESS(f"User '{username}' already exists. Use --reset-password to update.")
+            )
+
+    def _seed_users(self, users, reset_password):
+        """Create missing users with a single INSERT and update existing ones."""
+        to_create = []
+        # Join a caller's transaction (tests, call_command) without a SAVEPOINT
+        with transaction.atomic(savepoint=False):
+            existing = set(
+                User.objects.filter(username__in=[u["username"] for u in users])
+                .values_list("username", flat=True)
             )
-            role = "admin" if is_staff else "readonly"
+
+            for spec in users:
+                if spec["username"] in existing:
+                    self._update_user(spec["username"], spec, reset_password)
+                    continue
+
+                # Same normalization as create_user
+                to_create.append(User(
+                    username=User.normalize_username(spec["username"]),
+                    email=User.objects.normalize_email(spec["email"]),
+                    password=self._make_password(spec["password"]),
+                    is_staff=spec["is_staff"],
+                    is_superuser=spec["is_superuser"],
+                ))
+
+            # No ignore_conflicts: a user created concurrently fails the
+            # command rather than being reported as created
+            User.objects.bulk_create(to_create, batch_size=500)
+
+        for user in to_create:
+            role = "admin" if user.is_staff else "readonly"
             self.stdout.write(
-                self.style.SUCCESS(f"Created {role} user: {username}")
+                self.style.SUCCESS(f"Created {role} user: {user.username}")
             )
 
     def handle(self, *args, **options):
-        reset_password = options['reset_password'] or os.environ.get('RESET_ADMIN_PASSWORD', '').lower() == 'true'
+        reset_password = options['reset_password'] or _env_flag('RESET_ADMIN_PASSWORD')
+
+        # Dev/CI only: users seeded with the same password share one hash
+        # (same salt), which saves a PBKDF2 run but reveals they match
+        reuse_hashes = _env_flag('SEED_REUSE_PASSWORD_HASH')
+        self._password_hashes = {} if reuse_hashes else None
+
+        # Dev/CI only: hash with few PBKDF2 iterations to speed up cold starts.
+        # Django re-hashes with the configured iterations on the first login.
+        fast_hash = _env_flag('SEED_FAST_HASH')
+        if fast_hash and not settings.DEBUG:
+            self.stdout.write(
+                self.style.WARNING("SEED_FAST_HASH ignored: only allowed with DEBUG enabled")
+            )
+            fast_hash = False
+        self._fast_hasher = FastSeedPasswordHasher() if fast_hash else None
 
         # Create admin user
-        admin_username = os.environ.get('ADMIN_USERNAME', 'admin')
-        admin_email = os.environ.get('ADMIN_EMAIL', 'admin@example.com')
+        admin_username = options['admin_username']
+        admin_email = options['admin_email']
         admin_password = os.environ.get('ADMIN_PASSWORD')
 
         if not admin_password:
@@ -62,26 +147,30 @@ class Command(BaseCommand):
             )
             return
 
-        self._create_or_update_user(
-            username=admin_username,
-            email=admin_email,
-            password=admin_password,
-            is_staff=True,
-            is_superuser=True,
-            reset_password=reset_password,
-        )
+        users = [
+            dict(
+                username=admin_username,
+                email=admin_email,
+                password=admin_password,
+                is_staff=True,
+                is_superuser=True,
+            )
+        ]
 
         # Create readonly user (optional)
-        readonly_username = os.environ.get('READONLY_USERNAME')
+        readonly_username = options['readonly_username']
         readonly_password = os.environ.get('READONLY_PASSWORD')
-        readonly_email = os.environ.get('READONLY_EMAIL', 'readonly@example.com')
+        readonly_email = options['readonly_email']
 
         if readonly_username and readonly_password:
-            self._create_or_update_user(
-                username=readonly_username,
-                email=readonly_email,
-                password=readonly_password,
-                is_staff=False,
-                is_superuser=False,
-                reset_password=reset_password,
+            users.append(
+                dict(
+                    username=readonly_username,
+                    email=readonly_email,
+                    password=readonly_password,
+                    is_staff=False,
+                    is_superuser=False,
+                )
             )
+
+        self._seed_users(users, reset_password)
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:02
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_passwordresettoken"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="client",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="client_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="client",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("address"),
+                    name="gin_trgm_ops",
+                ),
+                name="client_address_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="client",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("locality"),
+                    name="gin_trgm_ops",
+                ),
+                name="client_locality_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="client",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("phone"), name="gin_trgm_ops"
+                ),
+                name="client_phone_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="client",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("gsm"), name="gin_trgm_ops"
+                ),
+                name="client_gsm_trgm",
+            ),
+        ),
+    ]
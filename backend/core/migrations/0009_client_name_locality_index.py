@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:03
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_client_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="client",
+            index=models.Index(
+                django.db.models.functions.text.Upper("name"),
+                django.db.models.functions.text.Upper("locality"),
+                name="client_name_locality_upper",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated manually
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def hash_existing_tokens(apps, schema_editor):
+    PasswordResetToken = apps.get_model("core", "PasswordResetToken")
+    for reset_token in PasswordResetToken.objects.only("id", "token"):
+        reset_token.token_hash = hashlib.sha256(reset_token.token.encode()).digest()
+        reset_token.save(update_fields=["token_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_client_name_locality_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="passwordresettoken",
+            name="token_hash",
+            field=models.BinaryField(max_length=32, null=True),
+        ),
+        migrations.RunPython(hash_existing_tokens, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="passwordresettoken",
+            name="token_hash",
+            field=models.BinaryField(max_length=32, unique=True),
+        ),
+        migrations.RemoveField(
+            model_name="passwordresettoken",
+            name="token",
+        ),
+    ]
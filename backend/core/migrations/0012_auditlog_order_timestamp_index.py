@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_passwordresettoken_token_hash"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="orderauditlog",
+            index=models.Index(
+                fields=["order", "-timestamp"], name="auditlog_order_ts_idx"
+            ),
+        ),
+    ]
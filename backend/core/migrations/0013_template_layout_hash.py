@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0012_auditlog_order_timestamp_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="template",
+            name="layout_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="SHA-256 of the seeded template definition",
+                max_length=64,
+            ),
+        ),
+    ]
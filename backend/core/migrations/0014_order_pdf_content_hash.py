@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0013_template_layout_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="pdf_content_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Digest of the order content the stored PDF was rendered from",
+                max_length=32,
+            ),
+        ),
+    ]
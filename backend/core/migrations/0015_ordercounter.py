@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0014_order_pdf_content_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderCounter",
+            fields=[
+                (
+                    "year",
+                    models.PositiveIntegerField(primary_key=True, serialize=False),
+                ),
+                ("last_num", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Compteur de références",
+                "verbose_name_plural": "Compteurs de références",
+            },
+        ),
+        # Start each year's counter from the highest reference already issued
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO "core_ordercounter" ("year", "last_num")
+                SELECT CAST(substr("reference", 4, 4) AS integer),
+                       MAX(CAST(substr("reference", 9) AS integer))
+                FROM "core_order"
+                WHERE "reference" ~ '^TC-[0-9]{4}-[0-9]+$'
+                GROUP BY 1
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:46
+
+import core.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0015_ordercounter"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="client",
+            name="id",
+            field=models.UUIDField(
+                default=core.ids.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="order",
+            name="id",
+            field=models.UUIDField(
+                default=core.ids.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="passwordresettoken",
+            name="id",
+            field=models.UUIDField(
+                default=core.ids.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0016_uuid7_primary_keys"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["status", "-created_at"], name="order_status_created_idx"
+            ),
+        ),
+    ]
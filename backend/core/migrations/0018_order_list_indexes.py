@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0017_order_status_created_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(fields=["-created_at"], name="order_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["reservation_date"], name="order_reservation_date_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,126 @@
+# Generated by Django 5.2.18 on 2026-10-14 17:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+NEW_CONSTRAINTS = {
+    "client_postal_code_valid",
+    "operatorconfig_postal_code_valid",
+    "order_operator_postal_code_valid",
+    "order_client_postal_code_valid",
+    "order_status_valid",
+}
+
+
+def validate_constraints(apps, schema_editor):
+    """
+    Validate each new constraint the existing rows satisfy.
+
+    Postal codes were not checked by the update endpoints, so old rows may
+    fail the pattern. Their constraints stay NOT VALID (still enforced on new
+    writes) and are reported, rather than failing the migration.
+    """
+    quote = schema_editor.quote_name
+    for model_name in ("Client", "OperatorConfig", "Order"):
+        model = apps.get_model("core", model_name)
+        for constraint in model._meta.constraints:
+            if constraint.name not in NEW_CONSTRAINTS:
+                continue
+            invalid = model._default_manager.exclude(constraint.condition).count()
+            if invalid:
+                print(
+                    f"\n  {constraint.name}: {invalid} existing row(s) violate it, left NOT VALID. "
+                    f"Fix them, then run: ALTER TABLE {quote(model._meta.db_table)} "
+                    f"VALIDATE CONSTRAINT {quote(constraint.name)};"
+                )
+                continue
+            schema_editor.execute(
+                f"ALTER TABLE {quote(model._meta.db_table)} "
+                f"VALIDATE CONSTRAINT {quote(constraint.name)}"
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0018_order_list_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Added NOT VALID so rows written before the constraints existed do
+        # not fail the migration; validated below where they allow it
+        migrations.RunSQL(
+            sql=[
+                r"""
+                ALTER TABLE "core_client"
+                    ADD CONSTRAINT "client_postal_code_valid"
+                    CHECK ("postal_code"::text ~ E'^\\d{4,5}$') NOT VALID
+                """,
+                r"""
+                ALTER TABLE "core_operatorconfig"
+                    ADD CONSTRAINT "operatorconfig_postal_code_valid"
+                    CHECK ("postal_code"::text ~ E'^\\d{4,5}$') NOT VALID
+                """,
+                r"""
+                ALTER TABLE "core_order"
+                    ADD CONSTRAINT "order_operator_postal_code_valid"
+                    CHECK ("operator_postal_code"::text ~ E'^\\d{4,5}$') NOT VALID,
+                    ADD CONSTRAINT "order_client_postal_code_valid"
+                    CHECK ("client_postal_code"::text ~ E'^\\d{4,5}$') NOT VALID,
+                    ADD CONSTRAINT "order_status_valid"
+                    CHECK ("status" IN ('draft', 'generated', 'sent', 'archived')) NOT VALID
+                """,
+            ],
+            reverse_sql=[
+                'ALTER TABLE "core_client" DROP CONSTRAINT "client_postal_code_valid"',
+                'ALTER TABLE "core_operatorconfig" DROP CONSTRAINT "operatorconfig_postal_code_valid"',
+                """
+                ALTER TABLE "core_order"
+                    DROP CONSTRAINT "order_operator_postal_code_valid",
+                    DROP CONSTRAINT "order_client_postal_code_valid",
+                    DROP CONSTRAINT "order_status_valid"
+                """,
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name="client",
+                    constraint=models.CheckConstraint(
+                        condition=models.Q(("postal_code__regex", "^\\d{4,5}$")),
+                        name="client_postal_code_valid",
+                    ),
+                ),
+                migrations.AddConstraint(
+                    model_name="operatorconfig",
+                    constraint=models.CheckConstraint(
+                        condition=models.Q(("postal_code__regex", "^\\d{4,5}$")),
+                        name="operatorconfig_postal_code_valid",
+                    ),
+                ),
+                migrations.AddConstraint(
+                    model_name="order",
+                    constraint=models.CheckConstraint(
+                        condition=models.Q(("operator_postal_code__regex", "^\\d{4,5}$")),
+                        name="order_operator_postal_code_valid",
+                    ),
+                ),
+                migrations.AddConstraint(
+                    model_name="order",
+                    constraint=models.CheckConstraint(
+                        condition=models.Q(("client_postal_code__regex", "^\\d{4,5}$")),
+                        name="order_client_postal_code_valid",
+                    ),
+                ),
+                migrations.AddConstraint(
+                    model_name="order",
+                    constraint=models.CheckConstraint(
+                        condition=models.Q(
+                            ("status__in", ["draft", "generated", "sent", "archived"])
+                        ),
+                        name="order_status_valid",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(validate_constraints, migrations.RunPython.noop),
+    ]
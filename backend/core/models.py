@@ -3,9 +3,13 @@ Django models for Annex 9 Generator.
 """
 
 import uuid
-from django.db import models
+from django.db import connection, models, transaction
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Upper
 from django.contrib.auth.models import User
-from django.core.validators import RegexValidator
+
+from .ids import uuid7
+from .validators import POSTAL_CODE_PATTERN, POSTAL_CODE_VALIDATOR
 
 
 class Template(models.Model):
@@ -17,6 +21,9 @@ class Template(models.Model):
     layout_spec = models.JSONField(
         default=dict, help_text="JSON specification for PDF layout"
     )
+    layout_hash = models.CharField(
+        max_length=64, blank=True, help_text="SHA-256 of the seeded template definition"
+    )
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -50,7 +57,7 @@ class OperatorConfig(models.Model):
     postal_code = models.CharField(
         max_length=10,
         verbose_name="Code postal",
-        validators=[RegexValidator(r"^\d{4,5}$", "Code postal invalide")],
+        validators=[POSTAL_CODE_VALIDATOR],
     )
     locality = models.CharField(max_length=100, verbose_name="Localité")
     bce_number = models.CharField(
@@ -71,6 +78,12 @@ class OperatorConfig(models.Model):
     class Meta:
         verbose_name = "Configuration Exploitant"
         verbose_name_plural = "Configuration Exploitant"
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(postal_code__regex=POSTAL_CODE_PATTERN),
+                name="operatorconfig_postal_code_valid",
+            ),
+        ]
 
     def __str__(self):
         return f"Exploitant: {self.name}"
@@ -103,7 +116,7 @@ class Client(models.Model):
         MONSIEUR = "Monsieur", "Monsieur"
         SOCIETE = "Société", "Société"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     title = models.CharField(
         max_length=20,
         choices=Title.choices,
@@ -116,7 +129,7 @@ class Client(models.Model):
     postal_code = models.CharField(
         max_length=10,
         verbose_name="Code postal",
-        validators=[RegexValidator(r"^\d{4,5}$", "Code postal invalide")],
+        validators=[POSTAL_CODE_VALIDATOR],
     )
     locality = models.CharField(max_length=100, verbose_name="Localité")
     phone = models.CharField(max_length=20, blank=True, verbose_name="Téléphone")
@@ -129,11 +142,34 @@ class Client(models.Model):
         verbose_name = "Client"
         verbose_name_plural = "Clients"
         ordering = ["name"]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(postal_code__regex=POSTAL_CODE_PATTERN),
+                name="client_postal_code_valid",
+            ),
+        ]
+        # Trigram indexes on UPPER(col) serve the __icontains lookups of the
+        # client search (Django emits UPPER(col) LIKE UPPER('%q%'))
+        indexes = [
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="client_name_trgm"),
+            GinIndex(OpClass(Upper("address"), name="gin_trgm_ops"), name="client_address_trgm"),
+            GinIndex(OpClass(Upper("locality"), name="gin_trgm_ops"), name="client_locality_trgm"),
+            GinIndex(OpClass(Upper("phone"), name="gin_trgm_ops"), name="client_phone_trgm"),
+            GinIndex(OpClass(Upper("gsm"), name="gin_trgm_ops"), name="client_gsm_trgm"),
+            # Serves the name/locality __iexact lookup of find-or-create
+            models.Index(Upper("name"), Upper("locality"), name="client_name_locality_upper"),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.locality})"
 
 
+class OrderQuerySet(models.QuerySet):
+    def with_related(self):
+        """Join the template and creator rows shown alongside an order."""
+        return self.select_related("template_version", "created_by")
+
+
 class Order(models.Model):
     """Order (Bon de commande) for taxi collectif service."""
 
@@ -149,7 +185,7 @@ class Order(models.Model):
         ALLER_RETOUR = "aller_retour", "Aller/Retour"
 
     # Primary fields
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     reference = models.CharField(
         max_length=50,
         unique=True,
@@ -187,7 +223,7 @@ class Order(models.Model):
     operator_postal_code = models.CharField(
         max_length=10,
         verbose_name="Code postal",
-        validators=[RegexValidator(r"^\d{4,5}$", "Code postal invalide")],
+        validators=[POSTAL_CODE_VALIDATOR],
     )
     operator_locality = models.CharField(max_length=100, verbose_name="Localité")
     operator_bce_number = models.CharField(
@@ -216,7 +252,7 @@ class Order(models.Model):
     client_postal_code = models.CharField(
         max_length=10,
         verbose_name="Code postal",
-        validators=[RegexValidator(r"^\d{4,5}$", "Code postal invalide")],
+        validators=[POSTAL_CODE_VALIDATOR],
     )
     client_locality = models.CharField(max_length=100, verbose_name="Localité")
     client_phone = models.CharField(max_length=20, blank=True, verbose_name="Téléphone")
@@ -319,34 +355,98 @@ class Order(models.Model):
     pdf_generated_at = models.DateTimeField(
         null=True, blank=True, verbose_name="Date de génération PDF"
     )
+    pdf_content_hash = models.CharField(
+        max_length=32,
+        blank=True,
+        editable=False,
+        help_text="Digest of the order content the stored PDF was rendered from",
+    )
+
+    objects = OrderQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Bon de commande"
         verbose_name_plural = "Bons de commande"
         ordering = ["-created_at"]
+        # API updates write with update(), which skips model validation
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(operator_postal_code__regex=POSTAL_CODE_PATTERN),
+                name="order_operator_postal_code_valid",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(client_postal_code__regex=POSTAL_CODE_PATTERN),
+                name="order_client_postal_code_valid",
+            ),
+            # Status values; Meta cannot see the nested Status class
+            models.CheckConstraint(
+                condition=models.Q(status__in=["draft", "generated", "sent", "archived"]),
+                name="order_status_valid",
+            ),
+        ]
+        indexes = [
+            # Serves the status filter of the order list, newest first
+            models.Index(fields=["status", "-created_at"], name="order_status_created_idx"),
+            # Unfiltered list pages: read the newest rows instead of sorting all
+            models.Index(fields=["-created_at"], name="order_created_idx"),
+            # date_from/date_to range filter and the admin date hierarchy
+            models.Index(fields=["reservation_date"], name="order_reservation_date_idx"),
+        ]
 
     def __str__(self):
         return f"{self.reference} - {self.client_name}"
 
     def save(self, *args, **kwargs):
-        # Auto-generate reference if not set
-        if not self.reference:
-            from django.utils import timezone
-
-            year = timezone.now().year
-            # Get the last order of this year
-            last_order = (
-                Order.objects.filter(reference__startswith=f"TC-{year}-")
-                .order_by("-reference")
-                .first()
+        if self.reference:
+            return super().save(*args, **kwargs)
+
+        # Auto-generate the reference; the counter increment rolls back
+        # with the INSERT if the save fails
+        from django.utils import timezone
+
+        year = timezone.now().year
+        with transaction.atomic():
+            self.reference = f"TC-{year}-{OrderCounter.next_number(year):06d}"
+            super().save(*args, **kwargs)
+
+
+class OrderCounter(models.Model):
+    """Last order reference number issued per year."""
+
+    year = models.PositiveIntegerField(primary_key=True)
+    last_num = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Compteur de références"
+        verbose_name_plural = "Compteurs de références"
+
+    def __str__(self):
+        return f"{self.year}: {self.last_num}"
+
+    @classmethod
+    def next_number(cls, year):
+        """Increment and return the year's counter in one statement.
+
+        The row lock taken by the upsert serializes concurrent callers until
+        their transaction ends, so two orders never get the same number.
+        """
+        table = connection.ops.quote_name(cls._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (year, last_num) VALUES (%s, 1)
+                ON CONFLICT (year) DO UPDATE SET last_num = {table}.last_num + 1
+                RETURNING last_num
+                """,
+                [year],
             )
-            if last_order:
-                last_num = int(last_order.reference.split("-")[-1])
-                new_num = last_num + 1
-            else:
-                new_num = 1
-            self.reference = f"TC-{year}-{new_num:06d}"
-        super().save(*args, **kwargs)
+            return cursor.fetchone()[0]
+
+
+class OrderAuditLogQuerySet(models.QuerySet):
+    def with_related(self):
+        """Join the order and user rows read by ``__str__`` and admin listings."""
+        return self.select_related("order", "user")
 
 
 class OrderAuditLog(models.Model):
@@ -360,10 +460,16 @@ class OrderAuditLog(models.Model):
     timestamp = models.DateTimeField(auto_now_add=True)
     details = models.JSONField(default=dict)
 
+    objects = OrderAuditLogQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Journal d'audit"
         verbose_name_plural = "Journaux d'audit"
         ordering = ["-timestamp"]
+        # Serves the per-order, newest-first listing of the admin inline
+        indexes = [
+            models.Index(fields=["order", "-timestamp"], name="auditlog_order_ts_idx"),
+        ]
 
     def __str__(self):
         return f"{self.order.reference} - {self.action} - {self.timestamp}"
@@ -372,11 +478,12 @@ class OrderAuditLog(models.Model):
 class PasswordResetToken(models.Model):
     """Token for password reset requests."""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="password_reset_tokens"
     )
-    token = models.CharField(max_length=100, unique=True)
+    # SHA-256 of the emailed token; the raw token is never stored
+    token_hash = models.BinaryField(max_length=32, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField()
     used_at = models.DateTimeField(null=True, blank=True)
@@ -395,22 +502,56 @@ class PasswordResetToken(models.Model):
         from django.utils import timezone
         return self.used_at is None and self.expires_at > timezone.now()
 
+    @staticmethod
+    def hash_token(token):
+        """Return the digest stored for a raw reset token."""
+        import hashlib
+        return hashlib.sha256(token.encode()).digest()
+
     @classmethod
     def create_for_user(cls, user, hours_valid=24):
-        """Create a new password reset token for a user."""
+        """
+        Create a new password reset token for a user.
+
+        The raw token is only available on the returned instance as
+        ``token``; the database keeps its hash.
+        """
         import secrets
         from django.utils import timezone
 
-        # Invalidate any existing unused tokens for this user
-        cls.objects.filter(user=user, used_at__isnull=True).update(
-            used_at=timezone.now()
-        )
-
         token = secrets.token_urlsafe(32)
-        expires_at = timezone.now() + timezone.timedelta(hours=hours_valid)
-
-        return cls.objects.create(
+        now = timezone.now()
+        reset_token = cls(
             user=user,
-            token=token,
-            expires_at=expires_at
+            token_hash=cls.hash_token(token),
+            created_at=now,
+            expires_at=now + timezone.timedelta(hours=hours_valid),
         )
+
+        # Invalidate any existing unused tokens for this user and insert the
+        # new one in a single statement (one round trip, one commit)
+        table = connection.ops.quote_name(cls._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH invalidated AS (
+                    UPDATE {table} SET used_at = %s
+                    WHERE user_id = %s AND used_at IS NULL
+                )
+                INSERT INTO {table} (id, user_id, token_hash, created_at, expires_at)
+                VALUES (%s, %s, %s, %s, %s)
+                """,
+                [
+                    now,
+                    user.pk,
+                    reset_token.id,
+                    user.pk,
+                    reset_token.token_hash,
+                    now,
+                    reset_token.expires_at,
+                ],
+            )
+        reset_token._state.adding = False
+        reset_token._state.db = connection.alias
+        reset_token.token = token
+        return reset_token
@@ -0,0 +1,11 @@
+"""
+Validators shared by the core models.
+"""
+
+from django.core.validators import RegexValidator
+
+# Also enforced by the models' CheckConstraints, for writes that skip validation
+POSTAL_CODE_PATTERN = r"^\d{4,5}$"
+
+# One instance for every postal code field, so the pattern is compiled once
+POSTAL_CODE_VALIDATOR = RegexValidator(POSTAL_CODE_PATTERN, "Code postal invalide")
@@ -186,9 +186,14 @@ export const signaturesApi = {
     return response.data
   },
 
-  // Public: Submit signature
+  // Public: Submit signature (sent as a raw PNG upload, not base64 JSON)
   submitSignature: async (token: string, signatureData: string): Promise<void> => {
-    await publicApi.post(`/signatures/public/${token}`, { signature_data: signatureData })
+    const blob = await (await fetch(signatureData)).blob()
+    const formData = new FormData()
+    formData.append('file', blob, 'signature.png')
+    await publicApi.post(`/signatures/public/${token}/binary`, formData, {
+      headers: { 'Content-Type': 'multipart/form-data' },
+    })
   },
 }
 